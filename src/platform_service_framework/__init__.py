@@ -1,5 +1,23 @@
-from .cli import app
+import sys
 
 
 def main() -> None:
+    # Shell rc files call `completions` on every new terminal, serve the cached
+    # script before importing the CLI.
+    if sys.argv[1:2] == ["completions"]:
+        from .completions import serve_cached
+
+        if serve_cached(sys.argv[2:]):
+            return
+
+    from .cli import app
+
     app()
+
+
+def __getattr__(name: str):
+    if name == "app":
+        from .cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,216 @@
+"""Persistent on-disk cache of git template sources.
+
+Every ``init``/``update``/``validate`` run renders the template from the git source
+the CLI was installed from, and copier clones that source again on each call. This
+module keeps full clones of remote sources on disk so that repeated runs, CI runners
+and air-gapped hosts can resolve templates locally.
+
+## Layout
+
+```
+<cache dir>/
+└── <sha256(url)[:16]>/
+    ├── <commit sha>/        # full clone, every remote branch mirrored locally
+    └── <commit sha>.json    # entry metadata, its mtime is the last use
+```
+
+Entries are content addressed by the resolved commit of the requested ref, so an
+entry never changes after it is created. The cache is bounded by size and the least
+recently used entries are evicted first.
+
+## Configuration
+
+- `FRAMEWORK_CACHE_DIR`: cache location [default to `$XDG_CACHE_HOME/platform-service-framework`]
+- `FRAMEWORK_CACHE_MAX_SIZE`: maximum cache size in MB [default to 1024]
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import mkdtemp
+
+_DEFAULT_MAX_SIZE_MB = 1024
+_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached clone of a template source at a given commit."""
+
+    url: str
+    ref: str | None
+    commit: str
+    path: Path
+    size: int
+    last_used: float
+
+    @property
+    def metadata_file(self) -> Path:
+        return self.path.with_suffix(".json")
+
+
+def cache_dir() -> Path:
+    """Return the root directory of the template cache."""
+    if env_dir := os.getenv("FRAMEWORK_CACHE_DIR"):
+        return Path(env_dir)
+    xdg_cache = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache) / "platform-service-framework"
+
+
+def max_cache_size() -> int:
+    """Return the cache size bound in bytes."""
+    return int(os.getenv("FRAMEWORK_CACHE_MAX_SIZE", _DEFAULT_MAX_SIZE_MB)) * 1024 * 1024
+
+
+def _url_dir(url: str) -> Path:
+    return cache_dir() / hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file() and not f.is_symlink())
+
+
+def _read_entry(metadata_file: Path) -> CacheEntry | None:
+    try:
+        metadata = json.loads(metadata_file.read_text())
+        return CacheEntry(
+            url=metadata["url"],
+            ref=metadata["ref"],
+            commit=metadata["commit"],
+            path=metadata_file.with_suffix(""),
+            size=metadata["size"],
+            last_used=metadata_file.stat().st_mtime,
+        )
+    except (OSError, KeyError, json.JSONDecodeError):
+        return None
+
+
+def list_entries() -> list[CacheEntry]:
+    """Return every cache entry, most recently used first."""
+    root = cache_dir()
+    if not root.exists():
+        return []
+    entries = [entry for f in root.glob("*/*.json") if (entry := _read_entry(f))]
+    return sorted(entries, key=lambda entry: entry.last_used, reverse=True)
+
+
+def _resolve_remote_commit(url: str, ref: str | None) -> str | None:
+    """Resolve ``ref`` to a commit SHA with ``git ls-remote`` (no clone).
+
+    Returns None when the ref is not advertised by the remote, e.g. abbreviated SHAs.
+    """
+    from git import Git
+
+    ref = ref or "HEAD"
+    if _SHA_RE.fullmatch(ref):
+        return ref
+    output = Git().ls_remote(url, ref, f"{ref}^{{}}")
+    matches = {name: sha for sha, name in (line.split("\t") for line in output.splitlines())}
+    # Annotated tags are advertised twice, the peeled (^{}) entry is the commit
+    for name in (f"refs/tags/{ref}^{{}}", f"refs/tags/{ref}", f"refs/heads/{ref}", ref):
+        if name in matches:
+            return matches[name]
+    return None
+
+
+def _find_cached(url: str, ref: str | None, commit: str | None) -> CacheEntry | None:
+    """Find an entry for ``url`` by commit, or by the ref it was fetched for."""
+    url_dir = _url_dir(url)
+    if commit:
+        return _read_entry(url_dir / f"{commit}.json")
+    entries = [entry for f in url_dir.glob("*.json") if (entry := _read_entry(f))]
+    for entry in sorted(entries, key=lambda entry: entry.last_used, reverse=True):
+        if entry.ref == ref or (ref and entry.commit.startswith(ref)):
+            return entry
+    return None
+
+
+def _fetch(url: str, ref: str | None) -> CacheEntry:
+    """Clone ``url`` into the cache and return the new entry."""
+    from git import Repo
+
+    url_dir = _url_dir(url)
+    url_dir.mkdir(parents=True, exist_ok=True)
+    tmp = Path(mkdtemp(prefix=".fetch-", dir=url_dir))
+    try:
+        repo = Repo.clone_from(url, tmp)
+        repo.git.fetch("origin", "+refs/heads/*:refs/heads/*", update_head_ok=True)
+        commit = repo.commit(ref or "HEAD").hexsha
+        repo.close()
+        entry_path = url_dir / commit
+        try:
+            # Atomic publish, a concurrent run may have fetched the same commit
+            tmp.rename(entry_path)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+        metadata = {"url": url, "ref": ref, "commit": commit, "size": _dir_size(entry_path)}
+        entry_path.with_suffix(".json").write_text(json.dumps(metadata, indent=2))
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp, ignore_errors=True)
+    entry = _read_entry(entry_path.with_suffix(".json"))
+    assert entry is not None
+    return entry
+
+
+def resolve(url: str, ref: str | None, offline: bool = False) -> CacheEntry:
+    """Return a cache entry for ``url`` at ``ref``, fetching it when missing.
+
+    Args:
+        url: Git URL of the template source
+        ref: Branch/tag/commit to resolve, None for the remote HEAD
+        offline: Never touch the network, fail if the ref is not cached
+
+    Returns:
+        The cache entry, its last use time is refreshed
+
+    Raises:
+        RuntimeError: If running offline and the ref is not cached
+    """
+    commit = None if offline else _resolve_remote_commit(url, ref)
+    entry = _find_cached(url, ref, commit)
+    if entry is None:
+        if offline:
+            raise RuntimeError(
+                f"Template {url}@{ref or 'HEAD'} is not cached and --offline was requested.\n"
+                "Run the command once without --offline to populate the cache."
+            )
+        entry = _fetch(url, ref)
+        prune(max_cache_size(), keep=entry)
+    else:
+        os.utime(entry.metadata_file)
+    return entry
+
+
+def remove(entry: CacheEntry) -> None:
+    """Delete a cache entry from disk."""
+    entry.metadata_file.unlink(missing_ok=True)
+    shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def prune(max_size: int = 0, keep: CacheEntry | None = None) -> list[CacheEntry]:
+    """Evict least recently used entries until the cache fits in ``max_size`` bytes.
+
+    Args:
+        max_size: Size bound in bytes, 0 empties the cache
+        keep: Entry that must not be evicted, e.g. the one in use
+
+    Returns:
+        The evicted entries
+    """
+    entries = list_entries()
+    total = sum(entry.size for entry in entries)
+    evicted = []
+    for entry in reversed(entries):
+        if total <= max_size:
+            break
+        if keep is not None and entry.path == keep.path:
+            continue
+        remove(entry)
+        total -= entry.size
+        evicted.append(entry)
+    return evicted
@@ -1,18 +1,35 @@
 import io
+import json
 import os
 import sys
-from contextlib import redirect_stderr
-from importlib.metadata import distribution
+import textwrap
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime
+from enum import StrEnum
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Literal
 
-import yaml
-from copier import run_copy, run_recopy, run_update
 from cyclopts import App, Parameter
-from git import Repo
-from yaml import safe_load
 
-from .utils import get_repo
+from . import cache
+from .git_ops import Workspace
+from .utils import get_repo, restore_src_path, template_snapshot, write_answers
+
+# copier (jinja, pydantic, plumbum...), GitPython and PyYAML are imported by the
+# commands that use them, so `--help` and shell completions only pay for cyclopts.
+
+
+def run_copy(*args, **kwargs):
+    from copier import run_copy
+
+    return run_copy(*args, **kwargs)
+
+
+def run_update(*args, **kwargs):
+    from copier import run_update
+
+    return run_update(*args, **kwargs)
+
 
 app = App(
     name="platform-service-framework",
@@ -25,6 +42,8 @@ def init(
     destination: Path | None = None,
     project: Annotated[str | None, Parameter(alias="-p")] = None,
     apps: Annotated[list[str], Parameter(consume_multiple=True)] = ["api"],
+    jobs: Annotated[int | None, Parameter(alias="-j")] = None,
+    offline: bool = False,
 ):
     """Initialize a new Django Project.
 
@@ -38,6 +57,8 @@ def init(
     platform-service-framework init /tmp/foo
     # New project on named folder with 3 apps:
     platform-service-framework init my-service --apps api web core
+    # Render apps one at a time:
+    platform-service-framework init my-service --apps api web --jobs 1
 
     ```
     ---
@@ -45,7 +66,15 @@ def init(
         destination: The root of the repository
         project: project name [default to destination folder name]
         apps: names for each app to be initialized
+        jobs: number of apps rendered in parallel [default to the number of CPUs]
+        offline: use the cached template only, never touch the network
     """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from git import Repo
+
+    from .validation import record_render, write_manifest
+
     destination = destination or Path.cwd()
     project = project or destination.name.replace("-", "_")
     if not destination.exists():
@@ -60,52 +89,64 @@ def init(
 
     print(f"Initializing your project on {destination}")
     src_path, vcs_ref = get_repo()
-    run_copy(
-        src_path,
-        destination,
-        vcs_ref=vcs_ref,
-        data={
-            "project_name": project,
-            "template": "templates/project",
-            "src_branch": vcs_ref,
-            "apps": all_apps,
-            "app_name": "",
-        },
-    )
-    print("Main project created.")
-
     apps_destination = destination / "apps"
+    # Core first, then user apps, so output follows INSTALLED_APPS ordering
+    components = [("core", "templates/core")] + [(app_name, "templates/app") for app_name in apps]
 
-    # Create core app first (always required)
-    run_copy(
-        src_path,
-        apps_destination / "core",
-        vcs_ref=vcs_ref,
-        data={
-            "project_name": project,
-            "app_name": "core",
-            "template": "templates/core",
-            "src_branch": vcs_ref,
-            "apps": all_apps,
-        },
-    )
-    print("Created core app")
-
-    # Create user-specified apps
-    for app_name in apps:
+    with (
+        template_snapshot(src_path, vcs_ref, offline=offline) as snapshot_path,
+        record_render(destination) as rendered,
+    ):
         run_copy(
-            src_path,
-            apps_destination / app_name,
+            snapshot_path,
+            destination,
             vcs_ref=vcs_ref,
             data={
                 "project_name": project,
-                "app_name": app_name,
-                "template": "templates/app",
+                "template": "templates/project",
                 "src_branch": vcs_ref,
                 "apps": all_apps,
+                "app_name": "",
             },
         )
-        print(f"Created app {app_name}")
+        print("Main project created.")
+
+        app_data = {
+            app_name: {
+                "project_name": project,
+                "app_name": app_name,
+                "template": template,
+                "src_branch": vcs_ref,
+                "apps": all_apps,
+            }
+            for app_name, template in components
+        }
+        jobs = min(jobs or os.cpu_count() or 1, len(app_data))
+        if jobs > 1:
+            # Copier changes the process working directory while cloning, so apps are
+            # rendered in separate processes. Their output is silenced and progress is
+            # reported in submission order to keep it deterministic.
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    app_name: executor.submit(
+                        _copy_app, snapshot_path, apps_destination / app_name, vcs_ref, data, True
+                    )
+                    for app_name, data in app_data.items()
+                }
+                for app_name, future in futures.items():
+                    future.result()
+                    _print_app_created(app_name)
+        else:
+            for app_name, data in app_data.items():
+                _copy_app(snapshot_path, apps_destination / app_name, vcs_ref, data)
+                _print_app_created(app_name)
+
+        write_manifest(destination, snapshot_path, rendered)
+
+    if snapshot_path != src_path:
+        restore_src_path(destination / ".copier-answers.yml", src_path)
+        for app_name in all_apps:
+            restore_src_path(apps_destination / app_name / ".copier-answers.yml", src_path)
 
     # Ensure apps is a Python module so each app can be imported
     Path(apps_destination / "__init__.py").touch()
@@ -139,10 +180,37 @@ Template version: {vcs_ref or "HEAD"}
         print("You may want to commit manually with: git add -A && git commit")
 
 
+def _copy_app(
+    src_path: str, dst_path: Path, vcs_ref: str | None, data: dict, quiet: bool = False
+) -> None:
+    """Render a single app template, runs in a worker process when init is parallel."""
+    run_copy(src_path, dst_path, vcs_ref=vcs_ref, data=data, quiet=quiet)
+
+
+def _print_app_created(app_name: str) -> None:
+    print("Created core app" if app_name == "core" else f"Created app {app_name}")
+
+
+class UpdateStatus(StrEnum):
+    """Outcome of updating one repository."""
+
+    UPDATED = "updated"
+    NO_OP = "no-op"
+    CONFLICT = "conflict"
+    VALIDATION_FAILED = "validation failed"
+    ERROR = "error"
+
+
 @app.command
 def update(
     destination: Path | None = None,
     core: Annotated[bool, Parameter(alias="-c")] = False,
+    apps: Annotated[list[str] | None, Parameter(consume_multiple=True)] = None,
+    per_component: bool = False,
+    jobs: Annotated[int | None, Parameter(alias="-j")] = None,
+    offline: bool = False,
+    intermediate_commits: bool = True,
+    dry_run: bool = False,
 ):
     """Update an existing application.
 
@@ -154,35 +222,131 @@ def update(
     platform-service-framework update
     # Update project and core app:
     platform-service-framework update --core
+    # Update project, core and every app in a single commit:
+    platform-service-framework update --apps all
+    # Update project and two apps, one commit each:
+    platform-service-framework update --apps api web --per-component
+    # Update project and core app in a single commit:
+    platform-service-framework update --core --no-intermediate-commits
+    # Show the diff the update would apply and how long each phase takes:
+    platform-service-framework update --dry-run
     ```
     ---
     Args:
         destination: The root of the repository
         core: Also update the core app from templates/core
+        apps: Also update these apps concurrently, `all` for every app with an answers file.
+            Can't be combined with --core, --no-intermediate-commits or --dry-run
+        per_component: With --apps, commit each component separately instead of once
+        jobs: With --apps, number of components updated in parallel [default to the number of CPUs]
+        offline: Use the cached template only, never touch the network
+        intermediate_commits: Commit the answers file and each update separately,
+            --no-intermediate-commits squashes them into a single commit
+        dry_run: Print the diff the project update would apply, without changing anything
     """
     destination = destination or Path.cwd()
-    print(f"Updating your app on {destination}")
+    if apps:
+        ignored = [
+            option
+            for option, given in (
+                ("--core", core),
+                ("--no-intermediate-commits", not intermediate_commits),
+                ("--dry-run", dry_run),
+            )
+            if given
+        ]
+        if ignored:
+            print(f"Error: {', '.join(ignored)} can't be combined with --apps.")
+            print("List core in --apps to update the core app, e.g. --apps core api.")
+            sys.exit(1)
+    elif per_component:
+        print("Error: --per-component can only be used with --apps.")
+        sys.exit(1)
+    if dry_run:
+        status = _preview_update(destination, offline)
+    elif apps:
+        status = _update_components(destination, apps, per_component, jobs, offline)
+    else:
+        status = _update_project(destination, core, offline, intermediate_commits)
+    if status not in (UpdateStatus.UPDATED, UpdateStatus.NO_OP):
+        sys.exit(1)
+
+
+def _preview_update(destination: Path, offline: bool) -> UpdateStatus:
+    """Print the diff an update of the project would apply and the time of each phase."""
+    from .preview import preview_update
 
+    print(f"Previewing update of {destination}", file=sys.stderr)
+    if not Path(destination / ".git").exists():
+        print(
+            "Platform service framework is only supported in git-tracked repositories."
+            " Please initialize your repository.",
+            file=sys.stderr,
+        )
+        return UpdateStatus.ERROR
+    if not (destination / ".copier-answers.yml").exists():
+        print(
+            "No answers file found (.copier-answers.yml), "
+            "please run the command from the root of the project",
+            file=sys.stderr,
+        )
+        return UpdateStatus.ERROR
+
+    src_path, vcs_ref = get_repo()
+    preview = preview_update(destination, src_path, vcs_ref, sys.stdout, offline=offline)
+
+    # The summary goes to stderr so the diff can be piped to a file or `git apply`
+    print(f"\n{len(preview.changed)} files would change", file=sys.stderr)
+    if not preview.clean:
+        print(
+            "Warning: Working tree has uncommitted changes, update would refuse to run.",
+            file=sys.stderr,
+        )
+    print(f"{'Phase':<16}  Time", file=sys.stderr)
+    for phase, seconds in preview.timer.timings.items():
+        print(f"{phase:<16}  {seconds:.2f}s", file=sys.stderr)
+    return UpdateStatus.NO_OP
+
+
+def _check_can_update(workspace: Workspace, offline: bool) -> UpdateStatus | None:
+    """Check the working tree is clean and the project valid, None when it can be updated."""
+    destination = workspace.path
     # Check working tree is clean (unique to update, not needed for validate)
     if Path(destination / ".git").exists():
         try:
-            repo = Repo(destination)
-            if repo.is_dirty(untracked_files=True):
+            if not workspace.status().clean:
                 print("Error: Working tree has uncommitted changes.")
                 print("Please commit or stash your changes before running update.")
-                sys.exit(1)
+                return UpdateStatus.ERROR
             print("Working tree is clean")
         except Exception as e:
             print(f"Error: Could not check git status: {e}")
-            sys.exit(1)
+            return UpdateStatus.ERROR
 
     # Validate before making any changes (checks git repo and copier answers)
-    if not validate(destination):
+    if not validate(destination, offline=offline):
         print("\nValidation failed. Please fix the issues before updating.")
-        sys.exit(1)
+        return UpdateStatus.VALIDATION_FAILED
+    return None
+
+
+def _update_project(
+    destination: Path, core: bool = False, offline: bool = False, intermediate_commits: bool = True
+) -> UpdateStatus:
+    """Validate, update from the template and commit a single repository."""
+    import yaml
+
+    from .validation import manifest_paths, record_render, write_manifest
+
+    print(f"Updating your app on {destination}")
+    workspace = Workspace(destination)
+    if (status := _check_can_update(workspace, offline)) is not None:
+        return status
 
     # Detect current framework source
+    base = workspace.head
     src_path, vcs_ref = get_repo()
+    committed = False
 
     # Read current copier answers
     answers_file = destination / ".copier-answers.yml"
@@ -208,15 +372,13 @@ def update(
             answers["src_branch"] = vcs_ref
 
         # Write updated answers
-        with open(answers_file, "w") as f:
-            f.write("# Changes here will be overwritten by Copier; NEVER EDIT MANUALLY\n")
-            yaml.dump(answers, f, default_flow_style=False, sort_keys=False)
+        write_answers(answers_file, answers)
 
         print("✓ Updated .copier-answers.yml")
 
         # Commit the source change
         try:
-            repo.git.add(str(answers_file))
+            workspace.stage([answers_file.name])
             commit_msg = f"""[platform-service-framework] Update template source
 
 Old source: {old_src}
@@ -227,7 +389,8 @@ Template version: {vcs_ref or "HEAD"}
 
 This commit updates .copier-answers.yml to point to the new template source.
 """
-            repo.index.commit(commit_msg)
+            workspace.commit(commit_msg)
+            committed = True
             print("✓ Committed .copier-answers.yml changes")
         except Exception as e:
             print(f"Warning: Could not commit .copier-answers.yml: {e}")
@@ -239,29 +402,35 @@ This commit updates .copier-answers.yml to point to the new template source.
     if vcs_ref:
         print(f"Using VCS ref: {vcs_ref}")
 
-    run_update(
-        destination,
-        vcs_ref=vcs_ref,
-        overwrite=True,
-        skip_answered=True,
-    )
+    old_files = manifest_paths(destination)
+    with (
+        template_snapshot(src_path, vcs_ref, offline=offline),
+        record_render(destination) as rendered,
+    ):
+        run_update(
+            destination,
+            vcs_ref=vcs_ref,
+            overwrite=True,
+            skip_answered=True,
+        )
+        write_manifest(destination, src_path, rendered)
 
     # Auto-commit if successful, error if conflicts
     try:
-        repo = Repo(destination)
+        status = workspace.status(_template_paths(destination, Path("."), old_files))
 
         # Check for merge conflicts
-        if repo.index.unmerged_blobs():
+        if status.conflicts:
             print("\nError: Merge conflicts detected during update.")
             print("Please resolve conflicts manually and commit the changes.")
             print("\nTo see conflicts:")
             print("  git status")
-            sys.exit(1)
+            return UpdateStatus.CONFLICT
 
         # Check if there are changes to commit
-        if repo.is_dirty(untracked_files=True):
+        if status.changed:
             print("\nCommitting update changes...")
-            repo.git.add(A=True)
+            workspace.stage(status.changed)
 
             commit_msg = f"""[platform-service-framework] Update project from template
 
@@ -270,7 +439,8 @@ Template version: {vcs_ref or "HEAD"}
 
 This commit applies updates from the template.
 """
-            repo.index.commit(commit_msg)
+            workspace.commit(commit_msg)
+            committed = True
             print("✓ Update committed successfully")
         else:
             print("\nNo changes from update")
@@ -278,31 +448,51 @@ This commit applies updates from the template.
     except Exception as e:
         print(f"\nError: Could not commit update: {e}")
         print("Please review and commit changes manually.")
-        sys.exit(1)
+        return UpdateStatus.ERROR
 
     # Update core app if requested
+    status = UpdateStatus.UPDATED if committed else UpdateStatus.NO_OP
     if core:
-        _update_core_app(destination, src_path, vcs_ref)
+        core_status = _update_core_app(workspace, src_path, vcs_ref, offline)
+        if core_status != UpdateStatus.NO_OP:
+            status = core_status
+
+    # Copier needs a clean tree before each stage, so intermediate commits are
+    # always made and squashed at the end
+    if not intermediate_commits and status == UpdateStatus.UPDATED:
+        workspace.squash(
+            base,
+            f"""[platform-service-framework] Update project from template
+
+Template source: {src_path}
+Template version: {vcs_ref or "HEAD"}""",
+        )
+        print("✓ Squashed the update into a single commit")
+    return status
 
 
-def _update_core_app(destination: Path, src_path: str, vcs_ref: str | None):
+def _update_core_app(
+    workspace: Workspace, src_path: str, vcs_ref: str | None, offline: bool = False
+) -> UpdateStatus:
     """Update the core app from templates/core."""
-    core_path = destination / "apps" / "core"
+    import yaml
+
+    core_path = workspace.path / "apps" / "core"
 
     if not core_path.exists():
         print("\nWarning: Core app not found at apps/core/. Skipping core update.")
-        return
+        return UpdateStatus.NO_OP
 
     core_answers_file = core_path / ".copier-answers.yml"
     if not core_answers_file.exists():
         print("\nWarning: Core app missing .copier-answers.yml. Skipping core update.")
-        return
+        return UpdateStatus.NO_OP
 
     print("\n" + "=" * 40)
     print("Updating core app...")
     print("=" * 40)
 
-    repo = Repo(destination)
+    committed = False
 
     # Read core app's copier answers
     with open(core_answers_file) as f:
@@ -323,15 +513,13 @@ def _update_core_app(destination: Path, src_path: str, vcs_ref: str | None):
             core_answers["src_branch"] = vcs_ref
 
         # Write updated answers
-        with open(core_answers_file, "w") as f:
-            f.write("# Changes here will be overwritten by Copier; NEVER EDIT MANUALLY\n")
-            yaml.dump(core_answers, f, default_flow_style=False, sort_keys=False)
+        write_answers(core_answers_file, core_answers)
 
         print("✓ Updated core .copier-answers.yml")
 
         # Commit the source change
         try:
-            repo.git.add(str(core_answers_file))
+            workspace.stage(["apps/core/.copier-answers.yml"])
             commit_msg = f"""[platform-service-framework] Update core app template source
 
 Old source: {old_src}
@@ -339,32 +527,36 @@ Old branch: {old_branch}
 New source: {src_path}
 New branch: {vcs_ref}
 """
-            repo.index.commit(commit_msg)
+            workspace.commit(commit_msg)
+            committed = True
             print("✓ Committed core .copier-answers.yml changes")
         except Exception as e:
             print(f"Warning: Could not commit core .copier-answers.yml: {e}")
 
     # Run copier update on core app
     print("\nRunning copier update on core app...")
-    run_update(
-        core_path,
-        vcs_ref=vcs_ref,
-        overwrite=True,
-        skip_answered=True,
-    )
+    with template_snapshot(src_path, vcs_ref, offline=offline):
+        run_update(
+            core_path,
+            vcs_ref=vcs_ref,
+            overwrite=True,
+            skip_answered=True,
+        )
 
     # Commit core app changes
     try:
+        status = workspace.status(["apps/core"])
+
         # Check for merge conflicts
-        if repo.index.unmerged_blobs():
+        if status.conflicts:
             print("\nError: Merge conflicts detected during core app update.")
             print("Please resolve conflicts manually and commit the changes.")
-            sys.exit(1)
+            return UpdateStatus.CONFLICT
 
         # Check if there are changes to commit
-        if repo.is_dirty(untracked_files=True):
+        if status.changed:
             print("\nCommitting core app update changes...")
-            repo.git.add(A=True)
+            workspace.stage(status.changed)
 
             commit_msg = f"""[platform-service-framework] Update core app from template
 
@@ -373,7 +565,8 @@ Template version: {vcs_ref or "HEAD"}
 
 This commit applies updates from templates/core.
 """
-            repo.index.commit(commit_msg)
+            workspace.commit(commit_msg)
+            committed = True
             print("✓ Core app update committed successfully")
         else:
             print("\nNo changes from core app update")
@@ -381,12 +574,381 @@ This commit applies updates from templates/core.
     except Exception as e:
         print(f"\nError: Could not commit core app update: {e}")
         print("Please review and commit changes manually.")
+        return UpdateStatus.ERROR
+
+    return UpdateStatus.UPDATED if committed else UpdateStatus.NO_OP
+
+
+def _update_components(
+    destination: Path, apps: list[str], per_component: bool, jobs: int | None, offline: bool
+) -> UpdateStatus:
+    """Update the project and its apps concurrently, then commit them together.
+
+    Copier refuses to update a dirty working tree and every update writes the git
+    index, so each component is updated and committed in its own worktree of HEAD.
+    The component commits only touch their own paths and are replayed here once,
+    squashed into a single commit unless ``per_component`` is set.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from tempfile import TemporaryDirectory
+
+    print(f"Updating your app on {destination}")
+    workspace = Workspace(destination)
+    if (status := _check_can_update(workspace, offline)) is not None:
+        return status
+
+    src_path, vcs_ref = get_repo()
+    if not Path(src_path).is_dir():
+        # Fetch the template once, workers then resolve it from the cache only
+        cache.resolve(src_path, vcs_ref, offline=offline)
+        offline = True
+
+    components = _discover_components(destination, apps)
+    repo = workspace.repo
+    base = workspace.head
+    jobs = min(jobs or os.cpu_count() or 1, len(components))
+    print(f"Updating {len(components)} components with {jobs} workers")
+
+    with TemporaryDirectory(prefix="platform-service-framework-update-") as tmp:
+        worktrees = [Path(tmp) / str(index) for index in range(len(components))]
+        for worktree in worktrees:
+            repo.git.worktree("add", "--detach", str(worktree), base)
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(
+                        _update_component, worktree, component, src_path, vcs_ref, offline
+                    )
+                    for worktree, component in zip(worktrees, components)
+                ]
+                results = [future.result() for future in futures]
+        finally:
+            for worktree in worktrees:
+                repo.git.worktree("remove", "--force", str(worktree))
+
+    statuses = {}
+    commits = []
+    for component, (status, commit, output) in zip(components, results):
+        print(output, end="")
+        statuses[component] = status
+        if commit:
+            commits.append((component, commit))
+
+    updated = [
+        _component_label(c) for c, status in statuses.items() if status == UpdateStatus.UPDATED
+    ]
+    if commits:
+        print(f"\nCommitting {', '.join(updated)}...")
+        message = None
+        if not per_component:
+            message = f"""[platform-service-framework] Update project from template
+
+Components: {", ".join(updated)}
+Template source: {src_path}
+Template version: {vcs_ref or "HEAD"}
+
+This commit applies updates from the template.
+"""
+        if (status := _apply_component_commits(workspace, commits, message)) is not None:
+            return status
+    else:
+        print("\nNo changes from update")
+
+    conflicted = [c for c, status in statuses.items() if status == UpdateStatus.CONFLICT]
+    if conflicted:
+        # Conflicts can't be carried over from a worktree, reproduce the first one here
+        status, _, output = _update_component(
+            destination, conflicted[0], src_path, vcs_ref, offline
+        )
+        print(output, end="")
+        statuses[conflicted[0]] = status
+        if len(conflicted) > 1:
+            others = ", ".join(_component_label(c) for c in conflicted[1:])
+            print(f"Run update again once resolved to update: {others}")
+
+    for status in (UpdateStatus.ERROR, UpdateStatus.CONFLICT):
+        if status in statuses.values():
+            return status
+    return UpdateStatus.UPDATED if commits else UpdateStatus.NO_OP
+
+
+def _apply_component_commits(
+    workspace: Workspace, commits: list[tuple[Path, str]], message: str | None
+) -> UpdateStatus | None:
+    """Replay the component commits, squashed with ``message`` unless it is None.
+
+    Returns:
+        None once committed, the failure status after restoring the branch otherwise
+    """
+    repo = workspace.repo
+    head = workspace.head
+    component = None
+    try:
+        # One component at a time, so a conflict can be reported with its component
+        for component, commit in commits:
+            repo.git.cherry_pick(commit, no_commit=True)
+            if message is None:
+                repo.index.commit(repo.commit(commit).message)
+        component = None
+        if message is not None:
+            repo.index.commit(message)
+        print("✓ Update committed successfully")
+    except Exception as e:
+        _restore_head(repo, head)
+        if component is None:
+            print(f"\nError: Could not commit update: {e}")
+        else:
+            print(f"\nError: The {_component_label(component)} update conflicts: {e}")
+        print(f"The repository was restored to {head[:12]}, no component was committed.")
+        return UpdateStatus.ERROR if component is None else UpdateStatus.CONFLICT
+    return None
+
+
+def _restore_head(repo, head: str) -> None:
+    """Abort an interrupted cherry-pick and move the current branch back to ``head``."""
+    from git import GitCommandError
+
+    try:
+        repo.git.cherry_pick("--abort")
+    except GitCommandError:
+        # No cherry-pick in progress, `--no-commit` picks may leave none
+        pass
+    repo.git.reset("--hard", head)
+
+
+def _discover_components(destination: Path, apps: list[str]) -> list[Path]:
+    """Return the project root followed by the requested apps, core first."""
+    apps_path = destination / "apps"
+    if apps == ["all"]:
+        names = sorted(path.parent.name for path in apps_path.glob("*/.copier-answers.yml"))
+    else:
+        names = []
+        for name in apps:
+            if (apps_path / name / ".copier-answers.yml").exists():
+                names.append(name)
+            else:
+                print(f"Warning: App {name} missing .copier-answers.yml. Skipping its update.")
+    names.sort(key=lambda name: name != "core")
+    return [Path(".")] + [Path("apps") / name for name in names]
+
+
+def _component_label(component: Path) -> str:
+    if component == Path("."):
+        return "project"
+    return "core app" if component.name == "core" else f"app {component.name}"
+
+
+def _update_component(
+    tree: Path, component: Path, src_path: str, vcs_ref: str | None, offline: bool
+) -> tuple[UpdateStatus, str | None, str]:
+    """Run `_commit_component_update` in a worker process and capture its output."""
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            status, commit = _commit_component_update(tree, component, src_path, vcs_ref, offline)
+        except Exception as e:
+            print(f"Error: {e}")
+            status, commit = UpdateStatus.ERROR, None
+    return status, commit, output.getvalue()
+
+
+def _commit_component_update(
+    tree: Path, component: Path, src_path: str, vcs_ref: str | None, offline: bool
+) -> tuple[UpdateStatus, str | None]:
+    """Update one component of ``tree`` and commit it, returning the commit SHA."""
+    import yaml
+
+    from .validation import manifest_paths, record_render, write_manifest
+
+    label = _component_label(component)
+    print("\n" + "=" * 40)
+    print(f"Updating {label}...")
+    print("=" * 40)
+
+    workspace = Workspace(tree)
+    base = workspace.head
+    answers_file = tree / component / ".copier-answers.yml"
+    answers = yaml.safe_load(answers_file.read_text())
+    if answers.get("_src_path") != src_path or answers.get("src_branch") != vcs_ref:
+        print(f"Updating {label} template source to: {src_path} ({vcs_ref or 'HEAD'})")
+        answers["_src_path"] = src_path
+        answers["src_branch"] = vcs_ref
+        write_answers(answers_file, answers)
+        # Copier only updates clean working trees, squashed with the update below
+        workspace.stage([(component / ".copier-answers.yml").as_posix()])
+        workspace.commit(f"[platform-service-framework] Update {label} template source")
+
+    print(f"\nRunning copier update on {label}...")
+    old_files = manifest_paths(tree)
+    with (
+        template_snapshot(src_path, vcs_ref, offline=offline),
+        record_render(tree / component) as rendered,
+    ):
+        run_update(tree / component, vcs_ref=vcs_ref, overwrite=True, skip_answered=True)
+        if component == Path("."):
+            write_manifest(tree, src_path, rendered)
+
+    status = workspace.status(_template_paths(tree, component, old_files))
+    if status.conflicts:
+        print(f"\nError: Merge conflicts detected during {label} update.")
+        print("Please resolve conflicts manually and commit the changes.")
+        return UpdateStatus.CONFLICT, None
+
+    if status.changed:
+        workspace.stage(status.changed)
+        workspace.commit(f"[platform-service-framework] Update {label} from template")
+    commit = workspace.squash(
+        base,
+        f"""[platform-service-framework] Update {label} from template
+
+Template source: {src_path}
+Template version: {vcs_ref or "HEAD"}""",
+    )
+    if commit is None:
+        print(f"\nNo changes from {label} update")
+        return UpdateStatus.NO_OP, None
+    print(f"✓ Updated {label}")
+    return UpdateStatus.UPDATED, commit
+
+
+def _template_paths(tree: Path, component: Path, old_files: set[str] | None) -> list[str] | None:
+    """Return the paths an update of ``component`` can write, None for the whole tree.
+
+    Apps only write below their folder. The project writes the files rendered before
+    and after the update, as recorded in the manifest.
+    """
+    from .validation import ANSWERS_FILE, MANIFEST_FILE, manifest_paths
+
+    if component != Path("."):
+        return [component.as_posix()]
+    new_files = manifest_paths(tree)
+    if old_files is None or new_files is None:
+        return None
+    return sorted(old_files | new_files | {ANSWERS_FILE, MANIFEST_FILE})
+
+
+@app.command
+def fleet(
+    repos: list[str] | None = None,
+    manifest: Annotated[Path | None, Parameter(alias="-m")] = None,
+    jobs: Annotated[int | None, Parameter(alias="-j")] = None,
+    core: Annotated[bool, Parameter(alias="-c")] = False,
+    offline: bool = False,
+    report: Path | None = None,
+):
+    """Update many service repositories concurrently.
+
+    Each repository goes through the same validate, update and commit steps as `update`.
+    The template is fetched once and shared by every repository.
+
+    ## Examples
+    ```bash
+    # Update every service checked out under ~/src:
+    platform-service-framework fleet '~/src/*-service'
+    # Update the repositories listed in a manifest and write a JSON report:
+    platform-service-framework fleet --manifest services.txt --report fleet.json
+    ```
+    ---
+    Args:
+        repos: repository paths or glob patterns
+        manifest: file listing one repository path or glob per line, relative to the file
+        jobs: number of repositories updated in parallel [default to the number of CPUs]
+        core: Also update the core app from templates/core
+        offline: Use the cached template only, never touch the network
+        report: write a machine-readable JSON report to this file
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    paths = _collect_repos(repos or [], manifest)
+    if not paths:
+        print("Error: No repositories to update, pass paths, globs or --manifest.")
         sys.exit(1)
 
+    src_path, vcs_ref = get_repo()
+    if not Path(src_path).is_dir():
+        # Fetch the template once, workers then resolve it from the cache only
+        cache.resolve(src_path, vcs_ref, offline=offline)
+        offline = True
+
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    print(f"Updating {len(paths)} repositories with {jobs} workers")
+    results = []
+    # Copier changes the process working directory, so repositories are updated in
+    # separate processes. Results are reported in the order repositories were given.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_fleet_update, path, core, offline) for path in paths]
+        for index, (path, future) in enumerate(zip(paths, futures), start=1):
+            status, output = future.result()
+            results.append({"path": str(path), "status": str(status), "output": output})
+            print(f"[{index}/{len(paths)}] {path}: {status}")
+            if status not in (UpdateStatus.UPDATED, UpdateStatus.NO_OP):
+                print(textwrap.indent(output.rstrip(), "    "))
+
+    width = max(len(result["path"]) for result in results)
+    print("\n" + f"{'Repository':<{width}}  Status")
+    print("-" * (width + 20))
+    for result in results:
+        print(f"{result['path']:<{width}}  {result['status']}")
+    summary = {str(status): 0 for status in UpdateStatus}
+    for result in results:
+        summary[result["status"]] += 1
+    print("\n" + ", ".join(f"{count} {status}" for status, count in summary.items() if count))
+
+    if report:
+        report.write_text(
+            json.dumps(
+                {
+                    "template": {"src_path": src_path, "vcs_ref": vcs_ref},
+                    "summary": summary,
+                    "repositories": results,
+                },
+                indent=2,
+            )
+        )
+        print(f"Report written to {report}")
+
+    if summary[UpdateStatus.UPDATED] + summary[UpdateStatus.NO_OP] != len(results):
+        sys.exit(1)
+
+
+def _collect_repos(repos: list[str], manifest: Path | None) -> list[Path]:
+    """Expand paths and globs from the command line and manifest, keeping their order."""
+    import glob
+
+    entries = [(Path.cwd(), repo) for repo in repos]
+    if manifest:
+        for line in manifest.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                entries.append((manifest.parent, line))
+
+    paths: dict[Path, None] = {}
+    for base, entry in entries:
+        pattern = str(base / Path(entry).expanduser())
+        is_glob = any(char in pattern for char in "*?[")
+        matches = sorted(glob.glob(pattern)) if is_glob else [pattern]
+        for match in matches:
+            paths.setdefault(Path(match).resolve(), None)
+    return list(paths)
+
+
+def _fleet_update(destination: Path, core: bool, offline: bool) -> tuple[UpdateStatus, str]:
+    """Run `_update_project` in a worker process and capture its output."""
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            status = _update_project(destination, core=core, offline=offline)
+        except Exception as e:
+            print(f"Error: {e}")
+            status = UpdateStatus.ERROR
+    return status, output.getvalue()
+
 
 @app.command
 def validate(
     destination: Path | None = None,
+    offline: bool = False,
+    format: Literal["text", "json"] = "text",
 ) -> bool:
     """Validate an existing application against the detected template version.
 
@@ -396,91 +958,151 @@ def validate(
     ```bash
     # Validate project against detected template:
     platform-service-framework validate
+    # Machine-readable result for CI:
+    platform-service-framework validate --format json
     ```
     ---
     Args:
         destination: The root of the repository
+        offline: Use the cached template only, never touch the network
+        format: Output format, json prints a single JSON document
     """
+    from .validation import validate_project
+
     destination = destination or Path.cwd()
-    print(f"Validating your app on {destination}")
+    if format == "text":
+        print(f"Validating your app on {destination}")
+
+    result = validate_project(destination, offline=offline)
+
+    if format == "json":
+        print(json.dumps(result.to_dict(), indent=2))
+        return result.valid
+
+    for message in result.errors + result.notes:
+        print(message)
+    if result.infractions:
+        print("✗ The following files should not be modified or deleted: ✗")
+        print("\n".join(f"{change.change}: {change.path}" for change in result.infractions))
+        print("✗ Please undo these changes and run the command again ✗")
+    elif result.valid:
+        print("✓ No framework infractions found, your project is ready to be updated! ✓")
+    return result.valid
 
-    # Check if it's a git repository
-    if not Path(destination / ".git").exists():
-        print(
-            "Platform service framework is only supported in git-tracked repositories."
-            " Please initialize your repository."
-        )
-        return False
 
-    # Check if it's a copier project
-    if not Path(destination / ".copier-answers.yml").exists():
+cache_app = App(name="cache", help="Manage the local template cache.")
+app.command(cache_app)
+
+
+def _format_size(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+@cache_app.command(name="list")
+def cache_list():
+    """List cached template sources, most recently used first.
+
+    ## Examples
+    ```bash
+    platform-service-framework cache list
+    ```
+    """
+    entries = cache.list_entries()
+    print(f"Cache directory: {cache.cache_dir()}")
+    if not entries:
+        print("Cache is empty")
+        return
+    for entry in entries:
+        last_used = datetime.fromtimestamp(entry.last_used).isoformat(sep=" ", timespec="seconds")
         print(
-            "No answers file found (.copier-answers.yml), "
-            "please run the command from the root of the project"
-        )
-        return False
-
-    copier_answers = safe_load((destination / ".copier-answers.yml").read_text())
-
-    # try to read _commit from answer if it doesnt exist return false
-    if "_commit" not in copier_answers:
-        print("Error: .copier-answers.yml is missing the '_commit' key. Cannot validate project.")
-        return False
-
-    # Run test copier "recopy" to retrieve possible conflicts
-    src_path, _ = get_repo()
-    f = io.StringIO()
-    with redirect_stderr(f):
-        run_recopy(
-            src_path=src_path,
-            dst_path=destination,
-            skip_answered=True,
-            overwrite=True,
-            vcs_ref=copier_answers.get("_commit"),
-            pretend=True,
+            f"{entry.commit[:12]}  {entry.ref or 'HEAD':<20} {_format_size(entry.size):>10}"
+            f"  {last_used}  {entry.url}"
         )
-    output = f.getvalue().splitlines()
-    # Read protected files defined under the framework config
-    config_path = destination / ".protected_files.yaml"
-    if not config_path.exists():
-        print("Note: .protected_files.yaml not found. Skipping protected files check.")
-        print("✓ No framework infractions found, your project is ready to be updated! ✓")
-        return True
+    total = sum(entry.size for entry in entries)
+    print(f"Total: {len(entries)} entries, {_format_size(total)}")
 
-    try:
-        config = safe_load(config_path.read_text())
-        if not config or "protected_files" not in config:
-            print(f"Error: {config_path} is missing 'protected_files' key.")
-            return False
-        protected_files = config["protected_files"]
-    except Exception as e:
-        print(f"Error: Failed to parse {config_path}: {e}")
-        return False
 
-    # Retrieve conflicts and compare them to the list of protected files
-    conflicts = [line for line in output if "conflict" in line or "create" in line]
-    infractions = list(
-        {conflict for conflict in conflicts for file in protected_files if file in conflict}
-    )
-    if infractions:
-        print("✗ The following files should not be modified or deleted: ✗")
-        print("\n".join(f"{i}" for i in infractions))
-        print("✗ Please undo these changes and run the command again ✗")
-        return False
+@cache_app.command(name="prune")
+def cache_prune(
+    max_size: int | None = None,
+    all: bool = False,
+):
+    """Evict least recently used cache entries.
+
+    ## Examples
+    ```bash
+    # Shrink the cache to the configured FRAMEWORK_CACHE_MAX_SIZE:
+    platform-service-framework cache prune
+    # Keep at most 200 MB of templates:
+    platform-service-framework cache prune --max-size 200
+    # Remove everything:
+    platform-service-framework cache prune --all
+    ```
+    ---
+    Args:
+        max_size: size bound in MB [default to FRAMEWORK_CACHE_MAX_SIZE or 1024]
+        all: remove every entry
+    """
+    if all:
+        limit = 0
+    elif max_size is not None:
+        limit = max_size * 1024 * 1024
     else:
-        print("✓ No framework infractions found, your project is ready to be updated! ✓")
-        return True
+        limit = cache.max_cache_size()
+    evicted = cache.prune(limit)
+    for entry in evicted:
+        print(f"Removed {entry.commit[:12]} ({entry.ref or 'HEAD'}) {entry.url}")
+    freed = sum(entry.size for entry in evicted)
+    print(f"✓ Pruned {len(evicted)} entries, freed {_format_size(freed)}")
 
 
 @app.command
-def completions():
-    """generate shell completions."""
-    print(app.generate_completion())
+def completions(
+    shell: Literal["bash", "zsh", "fish"] | None = None,
+    output: Path | None = None,
+    refresh: bool = False,
+):
+    """generate shell completions.
+
+    The script is cached per CLI version, so rc files that source it on every new
+    terminal don't pay for generating it again.
+
+    ## Examples
+    ```bash
+    # In ~/.bashrc
+    source <(platform-service-framework completions --shell bash)
+    # Or install a static file, loaded by zsh without running the CLI at all
+    platform-service-framework completions --shell zsh --output ~/.zfunc/_platform-service-framework
+    ```
+    ---
+    Args:
+        shell: Shell to generate the script for [default to $SHELL]
+        output: Write the script to this file instead of printing it
+        refresh: Regenerate the cached script
+    """
+    from . import completions as completion_cache
+
+    shell = shell or completion_cache.detect_shell()
+    if shell is None:
+        # Let cyclopts detect the shell, nothing to key the cache on
+        script = app.generate_completion()
+    elif refresh or (script := completion_cache.load(shell)) is None:
+        script = app.generate_completion(shell=shell)
+        completion_cache.store(shell, script)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(script)
+        print(f"Completion script written to {output}")
+    else:
+        print(script)
 
 
 @app.command
 def debug():
     """Show debug information about the framework installation."""
+    from importlib.metadata import distribution
+
     src_path, vcs_ref = get_repo()
     print(f"Template source: {src_path}")
     if vcs_ref:
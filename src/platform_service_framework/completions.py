@@ -0,0 +1,72 @@
+"""Cached shell completion scripts.
+
+Shell rc files generate the completion script on every new terminal, and generating
+it imports the whole CLI. The script only depends on the CLI definition, so it is
+generated once and stored under `<cache dir>/completions/`. Later calls are served by
+`serve_cached` from the entry point before cyclopts is even imported.
+
+The cache is keyed by a hash of `cli.py` rather than the package version, because git
+installs keep the same version across commits while their commands change.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from .cache import cache_dir
+
+PROG_NAME = "platform-service-framework"
+SHELLS = ("bash", "zsh", "fish")
+
+
+def detect_shell() -> str | None:
+    """Return the user's shell from `$SHELL` when it is supported."""
+    shell = Path(os.getenv("SHELL", "")).name
+    return shell if shell in SHELLS else None
+
+
+def completion_file(shell: str) -> Path:
+    """Return the cache file of the completion script for ``shell``."""
+    source = Path(__file__).with_name("cli.py").read_bytes()
+    key = hashlib.sha256(source).hexdigest()[:16]
+    return cache_dir() / "completions" / f"{PROG_NAME}-{key}.{shell}"
+
+
+def store(shell: str, script: str) -> Path:
+    """Write the completion script to the cache, removing stale scripts for ``shell``."""
+    path = completion_file(shell)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in path.parent.glob(f"{PROG_NAME}-*.{shell}"):
+        stale.unlink(missing_ok=True)
+    tmp = path.with_suffix(f".{shell}.tmp")
+    tmp.write_text(script)
+    tmp.replace(path)
+    return path
+
+
+def load(shell: str) -> str | None:
+    """Return the cached completion script for ``shell``, None when not generated yet."""
+    try:
+        return completion_file(shell).read_text()
+    except OSError:
+        return None
+
+
+def serve_cached(args: list[str]) -> bool:
+    """Print the cached script for ``completions [--shell SHELL]``.
+
+    Only plain invocations are handled, anything else returns False and is left to
+    the CLI, which also generates the script when it is not cached.
+    """
+    if not args:
+        shell = detect_shell()
+    elif len(args) == 2 and args[0] == "--shell":
+        shell = args[1]
+    elif len(args) == 1 and args[0].startswith("--shell="):
+        shell = args[0].removeprefix("--shell=")
+    else:
+        return False
+    if shell not in SHELLS or (script := load(shell)) is None:
+        return False
+    print(script)
+    return True
@@ -0,0 +1,87 @@
+"""Git operations shared by the update commands.
+
+An update goes through several stages (answers rewrite, template update, core app
+update) and each of them needs the working tree status and a commit. `Workspace` keeps
+a single `Repo` handle for the whole run, reads the status once per stage with a
+single `git status` call, and only stages the paths a stage could have written instead
+of walking the whole tree with `git add -A`.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+
+# Porcelain XY codes of unmerged paths, see git-status(1)
+_UNMERGED = {"DD", "AU", "UD", "UA", "DU", "AA", "UU"}
+# Keep command lines well below ARG_MAX when staging many paths
+_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class Status:
+    """Paths changed in the working tree or index, relative to the repository root."""
+
+    changed: list[str] = field(default_factory=list)
+    conflicts: list[str] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        return not self.changed and not self.conflicts
+
+
+class Workspace:
+    """A git working tree updated by the framework.
+
+    Args:
+        path: Root of the repository
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @cached_property
+    def repo(self):
+        from git import Repo
+
+        return Repo(self.path)
+
+    @property
+    def head(self) -> str:
+        return self.repo.head.commit.hexsha
+
+    def status(self, paths: list[str] | None = None) -> Status:
+        """Return the status of ``paths``, or of the whole tree when None."""
+        output = self.repo.git.status("--porcelain", "-z", "--", *(paths or []))
+        changed, conflicts = [], []
+        entries = iter(output.split("\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            code, path = entry[:2], entry[3:]
+            if code[0] in "RC":
+                # Renames and copies are followed by their source path
+                changed.append(next(entries))
+            (conflicts if code in _UNMERGED else changed).append(path)
+        return Status(changed, conflicts)
+
+    def stage(self, paths: list[str]) -> None:
+        """Stage additions, modifications and deletions of ``paths``."""
+        for start in range(0, len(paths), _CHUNK_SIZE):
+            self.repo.git.add("--all", "--", *paths[start : start + _CHUNK_SIZE])
+
+    def commit(self, message: str) -> str:
+        """Commit the index and return the new commit SHA."""
+        return self.repo.index.commit(message).hexsha
+
+    def squash(self, base: str, message: str) -> str | None:
+        """Squash every commit made on top of ``base`` into a single one.
+
+        Returns:
+            The new commit SHA, None when nothing was committed since ``base``
+        """
+        commits = list(self.repo.iter_commits(f"{base}..HEAD"))
+        if not commits:
+            return None
+        summaries = "\n".join(f"- {commit.summary}" for commit in reversed(commits))
+        self.repo.git.reset(base, soft=True)
+        return self.commit(f"{message}\n\nSquashed changes:\n{summaries}\n")
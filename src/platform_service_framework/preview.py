@@ -0,0 +1,144 @@
+"""Preview of what `update` would change, without touching the repository.
+
+The detected template version is rendered into a temporary directory. The files
+the template changed since the recorded ``_commit`` are then diffed against the
+working tree. The old render comes from the manifest when it is up to date, or is
+rendered again otherwise. Files the template did not touch are skipped because
+`update` keeps local changes to them.
+
+The diff is written file by file as it is computed, and the time spent in each phase
+is recorded so rollouts can be estimated across many repositories.
+"""
+
+import difflib
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TextIO
+
+from yaml import safe_load
+
+from .git_ops import Workspace
+from .utils import template_snapshot
+from .validation import (
+    ANSWERS_FILE,
+    MANIFEST_FILE,
+    file_digest,
+    iter_files,
+    load_manifest,
+    render_template,
+)
+
+_RENDER_PREFIX = "platform-service-framework-render-"
+
+
+class PhaseTimer:
+    """Wall-clock time spent in each phase, in the order phases first ran."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+
+@dataclass
+class UpdatePreview:
+    """Outcome of `preview_update`."""
+
+    changed: list[str] = field(default_factory=list)
+    clean: bool = True
+    timer: PhaseTimer = field(default_factory=PhaseTimer)
+
+
+def _read_lines(path: Path) -> list[str] | None:
+    """Return the lines of a text file, [] when missing and None when binary."""
+    if not path.is_file():
+        return []
+    try:
+        return path.read_text().splitlines(keepends=True)
+    except UnicodeDecodeError:
+        return None
+
+
+def diff_file(relpath: str, current: Path, new: Path) -> Iterator[str]:
+    """Yield the unified diff turning ``current`` into ``new``, missing files are empty."""
+    before, after = _read_lines(current), _read_lines(new)
+    if before is None or after is None:
+        yield f"Binary files a/{relpath} and b/{relpath} differ\n"
+        return
+    for line in difflib.unified_diff(
+        before,
+        after,
+        fromfile=f"a/{relpath}" if current.is_file() else "/dev/null",
+        tofile=f"b/{relpath}" if new.is_file() else "/dev/null",
+    ):
+        yield line if line.endswith("\n") else line + "\n\\ No newline at end of file\n"
+
+
+def preview_update(
+    destination: Path,
+    src_path: str,
+    vcs_ref: str | None,
+    out: TextIO,
+    offline: bool = False,
+) -> UpdatePreview:
+    """Write the diff `update` would apply to ``destination`` to ``out``.
+
+    Args:
+        destination: The root of the repository
+        src_path: Template source as returned by `get_repo`
+        vcs_ref: Template version the update would move to
+        out: Stream the diff is written to
+        offline: Use the cached template only, never touch the network
+
+    Returns:
+        The paths that would change, whether the working tree is clean and the time
+        spent in each phase
+    """
+    preview = UpdatePreview()
+    timer = preview.timer
+    answers = safe_load((destination / ANSWERS_FILE).read_text())
+    new_answers = {**answers, "src_branch": vcs_ref}
+
+    with timer.phase("git status"):
+        preview.clean = Workspace(destination).status().clean
+
+    with ExitStack() as stack:
+        with timer.phase("template fetch"):
+            stack.enter_context(template_snapshot(src_path, vcs_ref, offline=offline))
+        new = Path(stack.enter_context(TemporaryDirectory(prefix=_RENDER_PREFIX)))
+        with timer.phase("render"):
+            render_template(src_path, vcs_ref, new_answers, new)
+            old_hashes = {
+                relpath: entry["sha256"]
+                for relpath, entry in (load_manifest(destination, answers) or {}).items()
+            }
+            if not old_hashes:
+                old = Path(stack.enter_context(TemporaryDirectory(prefix=_RENDER_PREFIX)))
+                render_template(src_path, answers["_commit"], answers, old)
+                old_hashes = {relpath: file_digest(old / relpath) for relpath in iter_files(old)}
+
+        with timer.phase("diff"):
+            new_files = set(iter_files(new))
+            for relpath in sorted((new_files | set(old_hashes)) - {ANSWERS_FILE, MANIFEST_FILE}):
+                if relpath in new_files and old_hashes.get(relpath) == file_digest(new / relpath):
+                    continue
+                if not (destination / relpath).exists() and relpath not in new_files:
+                    continue
+                lines = diff_file(relpath, destination / relpath, new / relpath)
+                first = next(lines, None)
+                if first is None:
+                    continue
+                preview.changed.append(relpath)
+                out.write(first)
+                out.writelines(lines)
+    return preview
@@ -1,14 +1,21 @@
 """Utility functions for platform-service-framework CLI."""
 
 import json
-from importlib.metadata import distribution
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-from git import Repo
-
 # Constants
 _FILE_URL_PREFIX = "file://"
 _GIT_URL_PREFIX = "git+"
+_ANSWERS_HEADER = "# Changes here will be overwritten by Copier; NEVER EDIT MANUALLY\n"
+
+
+def distribution(name: str):
+    """Lazy `importlib.metadata.distribution`, importlib.metadata is slow to import."""
+    from importlib.metadata import distribution
+
+    return distribution(name)
 
 
 def _read_direct_url_metadata() -> dict:
@@ -57,6 +64,8 @@ def _get_local_repo_ref(repo_path: Path) -> str:
     Raises:
         RuntimeError: If repo is dirty or cannot be accessed
     """
+    from git import Repo
+
     try:
         local_repo = Repo(repo_path)
 
@@ -174,3 +183,81 @@ def get_repo() -> tuple[str, str | None]:
     # Handle git URLs
     vcs_info = direct_url_data.get("vcs_info", {})
     return _parse_git_url(url, vcs_info)
+
+
+@contextmanager
+def template_snapshot(
+    src_path: str, vcs_ref: str | None = None, offline: bool = False
+) -> Iterator[str]:
+    """Serve the template source from a local checkout shared by several copier runs.
+
+    Copier clones ``src_path`` on every ``run_copy``/``run_update``/``run_recopy`` call,
+    and updates clone it up to three times. For remote sources this resolves a local
+    clone from the persistent template cache (see `platform_service_framework.cache`)
+    and, while the context is active, redirects copier's git calls for ``src_path``
+    to it, including the ones made for the ``_src_path`` recorded in answers files.
+
+    Local sources are already on disk and are yielded unchanged.
+
+    Args:
+        src_path: Local path or git URL as returned by `get_repo`
+        vcs_ref: Branch/tag/commit that will be rendered
+        offline: Never touch the network, fail if the ref is not cached
+
+    Yields:
+        Path of a local git repository that can be used as copier ``src_path``
+
+    Raises:
+        RuntimeError: If running offline and the ref is not cached
+    """
+    if Path(src_path).is_dir():
+        yield src_path
+        return
+
+    # Imported here, plumbum holds the environment copier runs git with
+    from plumbum import local
+
+    from . import cache
+
+    entry = cache.resolve(src_path, vcs_ref, offline=offline)
+    count = int(local.env.get("GIT_CONFIG_COUNT", 0))
+    with local.env(
+        GIT_CONFIG_COUNT=str(count + 1),
+        **{
+            f"GIT_CONFIG_KEY_{count}": f"url.{entry.path}.insteadOf",
+            f"GIT_CONFIG_VALUE_{count}": src_path,
+        },
+    ):
+        yield str(entry.path)
+
+
+def write_answers(answers_file: Path, answers: dict) -> None:
+    """Write copier answers back to disk keeping copier's header and key order.
+
+    Args:
+        answers_file: Path to a ``.copier-answers.yml`` file
+        answers: Answers mapping to serialize
+    """
+    import yaml
+
+    with open(answers_file, "w") as f:
+        f.write(_ANSWERS_HEADER)
+        yaml.dump(answers, f, default_flow_style=False, sort_keys=False)
+
+
+def restore_src_path(answers_file: Path, src_path: str) -> None:
+    """Point ``_src_path`` in an answers file back to the real template source.
+
+    Rendering from a `template_snapshot` makes copier record the temporary
+    snapshot location, which would break later ``update`` runs.
+
+    Args:
+        answers_file: Path to a ``.copier-answers.yml`` file
+        src_path: The template source the snapshot was taken from
+    """
+    import yaml
+
+    answers = yaml.safe_load(answers_file.read_text())
+    if answers.get("_src_path") != src_path:
+        answers["_src_path"] = src_path
+        write_answers(answers_file, answers)
@@ -0,0 +1,369 @@
+"""Validation of a generated project against the template it was rendered from.
+
+The template is rendered at the ``_commit`` recorded in ``.copier-answers.yml`` into a
+temporary directory and every rendered file is compared with the working tree. Files are
+compared by size first and only hashed when sizes match. The paths that differ are then
+matched against the compiled patterns from ``.protected_files.yaml``.
+
+``init`` and ``update`` record the files copier renders in ``.copier-manifest.json``,
+next to ``.copier-answers.yml``. While the recorded commit and answers match, ``validate`` only
+stats and hashes the working tree against that manifest instead of rendering again.
+"""
+
+import hashlib
+import inspect
+import json
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from copier import run_copy
+from yaml import safe_load
+
+from .utils import get_repo, template_snapshot
+
+# Signature of the copier method `record_render` wraps, checked before wrapping it
+_RENDER_ALLOWED_PARAMS = ["self", "dst_relpath", "is_dir", "is_symlink", "expected_contents"]
+
+ANSWERS_FILE = ".copier-answers.yml"
+MANIFEST_FILE = ".copier-manifest.json"
+PROTECTED_FILES_CONFIG = ".protected_files.yaml"
+
+
+@dataclass(frozen=True)
+class FileChange:
+    """A rendered template file that differs in the working tree."""
+
+    path: str
+    change: str  # "modified" or "deleted"
+    protected: bool
+
+
+@dataclass
+class ValidationResult:
+    """Structured outcome of validating a project."""
+
+    destination: str
+    commit: str | None = None
+    changes: list[FileChange] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+    from_manifest: bool = False
+
+    @property
+    def infractions(self) -> list[FileChange]:
+        return [change for change in self.changes if change.protected]
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors and not self.infractions
+
+    def to_dict(self) -> dict:
+        return {
+            "valid": self.valid,
+            **asdict(self),
+            "infractions": [asdict(change) for change in self.infractions],
+        }
+
+
+# Glob tokens of protected file entries: `**` spans directories, `*`, `?` and
+# character classes stay within one path segment
+_GLOB_TOKENS = re.compile(r"\*\*/|\*\*|\*|\?|\[!?\]?[^\]]*\]")
+
+
+def _translate(pattern: str) -> str:
+    """Translate a glob to a regular expression matching whole relative paths."""
+    translated = []
+    position = 0
+    for token in _GLOB_TOKENS.finditer(pattern):
+        translated.append(re.escape(pattern[position : token.start()]))
+        glob = token.group()
+        if glob == "**/":
+            translated.append("(?:.*/)?")
+        elif glob == "**":
+            translated.append(".*")
+        elif glob == "*":
+            translated.append("[^/]*")
+        elif glob == "?":
+            translated.append("[^/]")
+        else:
+            negated = glob.startswith("[!")
+            chars = glob[2:-1] if negated else glob[1:-1]
+            # `^`, `[`, `]` and backslashes are literal in a glob class
+            chars = re.sub(r"([\\^\[\]])", r"\\\1", chars)
+            translated.append(f"[^/{chars}]" if negated else f"[{chars}]")
+        position = token.end()
+    translated.append(re.escape(pattern[position:]))
+    return "".join(translated)
+
+
+def compile_patterns(patterns: Iterable[str]) -> re.Pattern:
+    """Compile protected file entries into a single regular expression.
+
+    Entries are paths relative to the project root and may use glob syntax, where
+    ``*`` matches within a single directory and ``**`` across directories. An entry
+    also matches everything below it, so both ``my_project/`` and ``my_project``
+    protect the whole directory.
+    """
+    translated = []
+    for pattern in patterns:
+        pattern = pattern.strip().lstrip("/").rstrip("/")
+        if pattern:
+            translated.append(f"(?:{_translate(pattern)})(?:/.*)?")
+    if not translated:
+        return re.compile(r"(?!)")
+    return re.compile(f"(?s:{'|'.join(translated)})\\Z")
+
+
+def file_digest(path: Path) -> str:
+    """Return the sha256 hex digest of a file's content."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def iter_files(root: Path) -> Iterable[str]:
+    """Yield the paths of the files below ``root`` relative to it, in posix form."""
+    for path in root.rglob("*"):
+        if path.is_file() and ".git" not in path.parts:
+            yield path.relative_to(root).as_posix()
+
+
+def template_answers(answers: dict) -> dict:
+    """Return the answers that affect rendering, without copier's private keys."""
+    return {key: value for key, value in answers.items() if not key.startswith("_")}
+
+
+def answers_digest(answers: dict) -> str:
+    """Return a stable sha256 hex digest of the answers that affect rendering."""
+    serialized = json.dumps(template_answers(answers), sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def render_template(src_path: str, commit: str, answers: dict, destination: Path) -> None:
+    """Render the template at ``commit`` with the recorded ``answers`` into ``destination``."""
+    run_copy(
+        src_path,
+        destination,
+        vcs_ref=commit,
+        data=template_answers(answers),
+        defaults=True,
+        overwrite=True,
+        quiet=True,
+    )
+
+
+def diff_tree(rendered: Path, destination: Path, protected: re.Pattern) -> list[FileChange]:
+    """Compare every file rendered under ``rendered`` with the working tree."""
+    changes = []
+    for relpath in sorted(iter_files(rendered)):
+        if relpath == ANSWERS_FILE:
+            continue
+        local_file = destination / relpath
+        if not local_file.is_file():
+            change = "deleted"
+        elif local_file.stat().st_size != (rendered / relpath).stat().st_size:
+            change = "modified"
+        elif file_digest(local_file) != file_digest(rendered / relpath):
+            change = "modified"
+        else:
+            continue
+        changes.append(FileChange(relpath, change, bool(protected.match(relpath))))
+    return changes
+
+
+def diff_manifest(files: dict, destination: Path, protected: re.Pattern) -> list[FileChange]:
+    """Compare the files recorded in a manifest with the working tree."""
+    changes = []
+    for relpath, expected in sorted(files.items()):
+        local_file = destination / relpath
+        if not local_file.is_file():
+            change = "deleted"
+        elif local_file.stat().st_size != expected["size"]:
+            change = "modified"
+        elif file_digest(local_file) != expected["sha256"]:
+            change = "modified"
+        else:
+            continue
+        changes.append(FileChange(relpath, change, bool(protected.match(relpath))))
+    return changes
+
+
+def _render_allowed_hook():
+    """Return copier's `Worker` when `record_render` can wrap it, None otherwise."""
+    from copier._main import Worker
+
+    render_allowed = getattr(Worker, "_render_allowed", None)
+    if render_allowed is None:
+        return None
+    if list(inspect.signature(render_allowed).parameters) != _RENDER_ALLOWED_PARAMS:
+        return None
+    return Worker
+
+
+@contextmanager
+def record_render(destination: Path) -> Iterator[dict | None]:
+    """Record the files copier renders in ``destination`` while the context is active.
+
+    Copier compares every rendered file with the one on disk before writing it, the
+    rendered content is hashed there. Updates also render the old and new template in
+    temporary directories, only the files rendered in ``destination`` are recorded.
+
+    Yields:
+        The size and sha256 digest of the rendered files by relative path, filled as
+        copier renders them. None when the installed copier doesn't have the method
+        wrapped, `write_manifest` then renders the template again.
+    """
+    worker_cls = _render_allowed_hook()
+    if worker_cls is None:
+        yield None
+        return
+
+    root = destination.resolve()
+    files = {}
+    render_allowed = worker_cls._render_allowed
+
+    def record(worker, dst_relpath, is_dir=False, is_symlink=False, expected_contents=b""):
+        if not is_dir and not is_symlink and worker.subproject.local_abspath.resolve() == root:
+            files[dst_relpath.as_posix()] = {
+                "size": len(expected_contents),
+                "sha256": hashlib.sha256(expected_contents).hexdigest(),
+            }
+        return render_allowed(worker, dst_relpath, is_dir, is_symlink, expected_contents)
+
+    worker_cls._render_allowed = record
+    try:
+        yield files
+    finally:
+        worker_cls._render_allowed = render_allowed
+
+
+def write_manifest(destination: Path, src_path: str, files: dict | None) -> None:
+    """Write the manifest of the files rendered in ``destination``.
+
+    Args:
+        destination: The root of the repository, with an up to date answers file
+        src_path: Template source rendered again when ``files`` is None, a local path
+            or a cached git URL
+        files: The files recorded by `record_render` while rendering ``destination``
+
+    Raises:
+        RuntimeError: If no rendered file was recorded
+    """
+    answers = safe_load((destination / ANSWERS_FILE).read_text())
+    if files is None:
+        with TemporaryDirectory(prefix="platform-service-framework-render-") as rendered:
+            render_template(src_path, answers["_commit"], answers, Path(rendered))
+            files = {
+                relpath: {
+                    "size": (Path(rendered) / relpath).stat().st_size,
+                    "sha256": file_digest(Path(rendered) / relpath),
+                }
+                for relpath in iter_files(Path(rendered))
+            }
+    files = {relpath: files[relpath] for relpath in sorted(files) if relpath != ANSWERS_FILE}
+    if not files:
+        # An empty manifest would let validate pass whatever the working tree holds
+        raise RuntimeError(f"No rendered template file was recorded for {destination}")
+    manifest = {"commit": answers["_commit"], "answers": answers_digest(answers), "files": files}
+    (destination / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2) + "\n")
+
+
+def manifest_paths(destination: Path) -> set[str] | None:
+    """Return the files recorded in the manifest whatever its commit, None without one."""
+    try:
+        return set(json.loads((destination / MANIFEST_FILE).read_text())["files"])
+    except (OSError, KeyError, json.JSONDecodeError):
+        return None
+
+
+def load_manifest(destination: Path, answers: dict) -> dict | None:
+    """Return the manifest files when it was written for the current answers."""
+    try:
+        manifest = json.loads((destination / MANIFEST_FILE).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if manifest.get("commit") != answers["_commit"]:
+        return None
+    if manifest.get("answers") != answers_digest(answers):
+        return None
+    return manifest.get("files")
+
+
+def load_protected_patterns(destination: Path, result: ValidationResult) -> re.Pattern | None:
+    """Read ``.protected_files.yaml``, recording problems on ``result``.
+
+    Returns None when the protected files check must be skipped or failed.
+    """
+    config_path = destination / PROTECTED_FILES_CONFIG
+    if not config_path.exists():
+        result.notes.append(
+            f"Note: {PROTECTED_FILES_CONFIG} not found. Skipping protected files check."
+        )
+        return None
+    try:
+        config = safe_load(config_path.read_text())
+    except Exception as e:
+        result.errors.append(f"Error: Failed to parse {config_path}: {e}")
+        return None
+    if not config or "protected_files" not in config:
+        result.errors.append(f"Error: {config_path} is missing 'protected_files' key.")
+        return None
+    return compile_patterns(config["protected_files"] or [])
+
+
+def validate_project(destination: Path, offline: bool = False) -> ValidationResult:
+    """Validate ``destination`` against the template it was generated from.
+
+    Args:
+        destination: The root of the repository
+        offline: Use the cached template only, never touch the network
+
+    Returns:
+        The validation result, `ValidationResult.valid` tells if the project can be updated
+    """
+    result = ValidationResult(destination=str(destination))
+
+    if not Path(destination / ".git").exists():
+        result.errors.append(
+            "Platform service framework is only supported in git-tracked repositories."
+            " Please initialize your repository."
+        )
+        return result
+
+    answers_file = destination / ANSWERS_FILE
+    if not answers_file.exists():
+        result.errors.append(
+            "No answers file found (.copier-answers.yml), "
+            "please run the command from the root of the project"
+        )
+        return result
+
+    answers = safe_load(answers_file.read_text())
+    if "_commit" not in answers:
+        result.errors.append(
+            "Error: .copier-answers.yml is missing the '_commit' key. Cannot validate project."
+        )
+        return result
+    result.commit = answers["_commit"]
+
+    protected = load_protected_patterns(destination, result)
+    if protected is None:
+        return result
+
+    files = load_manifest(destination, answers)
+    if files is not None:
+        result.from_manifest = True
+        result.changes = diff_manifest(files, destination, protected)
+        return result
+
+    src_path, vcs_ref = get_repo()
+    with (
+        template_snapshot(src_path, vcs_ref, offline=offline),
+        TemporaryDirectory(prefix="platform-service-framework-render-") as rendered,
+    ):
+        render_template(src_path, result.commit, answers, Path(rendered))
+        result.changes = diff_tree(Path(rendered), destination, protected)
+    return result
@@ -8,10 +8,31 @@ class CoreConfig(AppConfig):
     def ready(self):
         from ansible_base.rbac.triggers import dab_post_migrate
 
+        from apps.core import visibility
+
         dab_post_migrate.connect(
             self._create_managed_roles,
             dispatch_uid="core.create_managed_roles",
         )
+        self._register_health_checks()
+        visibility.connect_signals()
+
+    @staticmethod
+    def _register_health_checks():
+        from django.conf import settings
+        from django.core.cache import caches
+        from django.core.cache.backends.dummy import DummyCache
+
+        from apps.core import health
+
+        health.register("database", health.check_database)
+        if not isinstance(caches["default"], DummyCache):
+            # The development and test settings use DummyCache, which never stores values
+            health.register("cache", health.check_cache)
+        health.register("migrations", health.check_migrations)
+        if getattr(settings, "RESOURCE_SERVER", {}).get("URL"):
+            # The service can still serve its own data without the gateway
+            health.register("resource_server", health.check_resource_server, critical=False)
 
     @staticmethod
     def _create_managed_roles(sender, **kwargs):
@@ -0,0 +1,127 @@
+"""
+Eager loading plans derived from serializers.
+
+Serializing a page of objects runs one query per object and relation that is not
+loaded with the page: the organization of every team, the members of every team...
+`plan(serializer)` walks the fields of a serializer and returns the `QueryPlan`
+loading everything they read with a constant number of queries:
+
+- forward foreign keys and one-to-one fields are joined with `select_related()`
+- many-to-many and reverse relations are fetched with `prefetch_related()`
+- nested serializers are planned recursively, below the lookup of their relation
+- only the serialized columns are loaded with `only()`, unless the serializer has
+  fields computing their value from the whole object (`source="*"`, e.g.
+  `SerializerMethodField`) or from model properties, which may read any column
+
+`BaseViewSet` applies the plan of its serializer to its queryset. Viewsets add the
+lookups the plan can't see (read by method fields) with `select_related` and
+`prefetch_related` attributes, or opt out with `eager_loading = False`.
+"""
+
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Lookups and columns to load with a queryset, `only` is None to load every column."""
+
+    select_related: tuple = ()
+    prefetch_related: tuple = ()
+    only: tuple | None = None
+
+    def extend(self, select_related=(), prefetch_related=()):
+        """Return the plan with more lookups, the relations joined are loaded with their columns."""
+        only = self.only
+        if only is not None:
+            only = tuple(dict.fromkeys(only + tuple(lookup.split("__", 1)[0] for lookup in select_related)))
+        return QueryPlan(
+            select_related=tuple(dict.fromkeys(self.select_related + tuple(select_related))),
+            prefetch_related=tuple(dict.fromkeys(self.prefetch_related + tuple(prefetch_related))),
+            only=only,
+        )
+
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only is not None:
+            queryset = queryset.only(*self.only)
+        return queryset
+
+
+class _Planner:
+    def __init__(self):
+        self.select_related = []
+        self.prefetch_related = []
+        self.columns = set()
+        self.restrict_columns = True
+
+    def walk(self, serializer, model, prefix="", prefetched=False):
+        top_level = not prefix
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            if field.source == "*" or not field.source_attrs:
+                if top_level:
+                    self.restrict_columns = False
+                continue
+            self.walk_field(field, model, prefix, prefetched, top_level)
+
+    def walk_field(self, field, model, prefix, prefetched, top_level):
+        # Dotted sources ("organization.name") follow relations
+        for depth, attr in enumerate(field.source_attrs):
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # Property or method of the model
+                if top_level and depth == 0:
+                    self.restrict_columns = False
+                return
+            many = model_field.many_to_many or model_field.one_to_many
+            if top_level and depth == 0:
+                if model_field.concrete and not many:
+                    self.columns.add(model_field.name)
+                elif model_field.related_model is None:
+                    # Generic foreign keys read columns they don't declare
+                    self.restrict_columns = False
+            if not model_field.is_relation:
+                return
+
+            path = f"{prefix}{attr}"
+            if many or not model_field.concrete or model_field.related_model is None:
+                # Reverse and many-to-many relations, generic foreign keys
+                prefetched = True
+            (self.prefetch_related if prefetched else self.select_related).append(path)
+            if model_field.related_model is None:
+                return
+            model, prefix = model_field.related_model, f"{path}__"
+
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        if isinstance(nested, serializers.Serializer):
+            self.walk(nested, model, prefix, prefetched)
+
+    def plan(self):
+        only = None
+        if self.restrict_columns:
+            # The relations joined at the top level are loaded with all their columns
+            only = tuple(sorted(self.columns))
+        return QueryPlan(
+            select_related=tuple(dict.fromkeys(self.select_related)),
+            prefetch_related=tuple(dict.fromkeys(self.prefetch_related)),
+            only=only,
+        )
+
+
+def plan(serializer):
+    """Return the `QueryPlan` loading the fields read by a model serializer."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    planner = _Planner()
+    model = serializer.Meta.model
+    planner.walk(serializer, model)
+    planner.columns.add(model._meta.pk.name)
+    return planner.plan()
@@ -0,0 +1,228 @@
+"""
+Health checks behind the liveness and readiness endpoints.
+
+A check is a callable that raises when its dependency is unavailable. Apps register
+their checks from `AppConfig.ready()`:
+
+    from apps.core import health
+
+    health.register("broker", check_broker)
+    health.register("search", check_search, critical=False, timeout=1)
+
+Checks are run concurrently in a thread pool, each bounded by its timeout
+(`HEALTH_CHECK_TIMEOUT` by default). A check that is still running from a previous
+probe is not started again, it keeps being reported as timed out until it returns.
+
+Reports are cached for `HEALTH_CHECK_CACHE_TTL` seconds, and probes arriving while
+the checks run wait for that run, so a burst of probes from many kubelets and load
+balancers runs the checks once.
+
+- `/livez/` runs the liveness checks only (none by default): the process serves requests.
+- `/readyz/` runs the readiness checks: the dependencies needed to serve traffic work.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+LIVENESS = "liveness"
+READINESS = "readiness"
+PROBES = (LIVENESS, READINESS)
+
+# Threads are only started when checks run concurrently, this bounds hung checks
+_MAX_WORKERS = 16
+
+
+@dataclass(frozen=True)
+class HealthCheck:
+    """A registered check."""
+
+    name: str
+    func: object
+    probes: frozenset
+    critical: bool
+    timeout: float | None
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    """Outcome of a single check, `detail` is "ok" or the error."""
+
+    name: str
+    ok: bool
+    critical: bool
+    detail: str = "ok"
+
+
+@dataclass(frozen=True)
+class HealthReport:
+    """Outcome of every check of a probe."""
+
+    results: tuple
+    checked_at: float
+
+    @property
+    def healthy(self):
+        """Non critical checks are reported but don't fail the probe."""
+        return all(result.ok for result in self.results if result.critical)
+
+    def to_dict(self):
+        return {
+            "status": "healthy" if self.healthy else "unhealthy",
+            "checks": {result.name: result.detail for result in self.results},
+        }
+
+
+_checks = {}
+_running = {}
+_reports = {}
+_locks = {probe: threading.Lock() for probe in PROBES}
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def register(name, func=None, *, probes=(READINESS,), critical=True, timeout=None):
+    """
+    Register a health check, can be used as a decorator.
+
+    Args:
+        name: Key of the check in the reports, registering a name again replaces it
+        func: Callable raising when the dependency is unavailable
+        probes: Probes running the check, `LIVENESS` and/or `READINESS`
+        critical: A failure fails the probe, otherwise it is only reported
+        timeout: Seconds before the check is reported as failed, defaults to
+            `HEALTH_CHECK_TIMEOUT`
+    """
+    if func is None:
+        return lambda func: register(name, func, probes=probes, critical=critical, timeout=timeout)
+    unknown = set(probes) - set(PROBES)
+    if unknown:
+        raise ValueError(f"Unknown health probes: {', '.join(sorted(unknown))}")
+    _checks[name] = HealthCheck(name, func, frozenset(probes), critical, timeout)
+    clear_cache()
+    return func
+
+
+def unregister(name):
+    """Remove a health check."""
+    _checks.pop(name, None)
+    clear_cache()
+
+
+def clear_cache():
+    """Forget the cached reports, the next probes run the checks."""
+    _reports.clear()
+
+
+def run_checks(probe):
+    """Return the report of ``probe``, from the cache while it is fresh."""
+    with _locks[probe]:
+        report = _reports.get(probe)
+        if report is None or time.monotonic() - report.checked_at >= settings.HEALTH_CHECK_CACHE_TTL:
+            report = _reports[probe] = _run(probe)
+        return report
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="health-check")
+        return _executor
+
+
+def _call(check):
+    try:
+        check.func()
+    finally:
+        # Database connections are per thread, don't keep one open per pool thread
+        connections.close_all()
+
+
+def _run(probe):
+    started = time.monotonic()
+    checks = [check for check in _checks.values() if probe in check.probes]
+    futures = []
+    for check in checks:
+        future = _running.get(check.name)
+        if future is None or future.done():
+            future = _running[check.name] = _get_executor().submit(_call, check)
+        futures.append((check, future))
+
+    results = []
+    for check, future in futures:
+        timeout = check.timeout or settings.HEALTH_CHECK_TIMEOUT
+        try:
+            future.result(timeout=max(0.0, started + timeout - time.monotonic()))
+        except FutureTimeoutError:
+            detail = f"error: timed out after {timeout}s"
+        except Exception as e:
+            detail = f"error: {str(e)}"
+        else:
+            results.append(CheckResult(check.name, True, check.critical))
+            continue
+        logger.warning("Health check %s failed: %s", check.name, detail)
+        results.append(CheckResult(check.name, False, check.critical, detail))
+    return HealthReport(tuple(results), time.monotonic())
+
+
+# Checks registered by the core app, see CoreConfig.ready()
+
+
+def check_database():
+    """Run a query on the default database."""
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+def check_cache():
+    """Write and read back a key of the default cache."""
+    from django.core.cache import cache
+
+    key = f"health-check-{threading.get_ident()}"
+    cache.set(key, "ok", timeout=10)
+    if cache.get(key) != "ok":
+        raise RuntimeError("value written to the cache could not be read back")
+
+
+_migrations_applied = False
+
+
+def check_migrations():
+    """
+    Check that every migration of the running code is applied.
+
+    Loading the migration graph is expensive, once applied the migrations are not
+    checked again for the lifetime of the process.
+    """
+    global _migrations_applied
+    if _migrations_applied:
+        return
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
+    if plan := executor.migration_plan(executor.loader.graph.leaf_nodes()):
+        raise RuntimeError(f"{len(plan)} unapplied migrations")
+    _migrations_applied = True
+
+
+def check_resource_server():
+    """Check that the resource server (gateway) answers."""
+    import requests
+
+    resource_server = settings.RESOURCE_SERVER
+    response = requests.get(
+        resource_server["URL"],
+        timeout=settings.HEALTH_CHECK_TIMEOUT,
+        verify=resource_server.get("VALIDATE_HTTPS", True),
+    )
+    if response.status_code >= 500:
+        raise RuntimeError(f"resource server returned {response.status_code}")
@@ -0,0 +1,69 @@
+"""Compile the settings into a snapshot loaded by the next processes."""
+
+import os
+import subprocess
+import sys
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs the full settings pipeline in a new interpreter, so settings files and hooks
+# already imported by this process are executed again from scratch
+COMPILE_SCRIPT = """
+import sys
+import time
+from importlib import import_module
+
+snapshot = import_module(sys.argv[2])
+snapshot.ENABLED = False
+start = time.perf_counter()
+try:
+    module = import_module(sys.argv[1])
+except Exception as e:
+    sys.exit(f"Failed to load the settings: {e}")
+elapsed = time.perf_counter() - start
+try:
+    path = snapshot.write(module.BASE_DIR, module.settings_digest, vars(module), module.IS_RUNNING_TESTS)
+except ValueError as e:
+    sys.exit(str(e))
+print(f"Settings compiled to {path} (full pipeline took {elapsed * 1000:.0f}ms)")
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Resolve the settings with the full Dynaconf pipeline and write them to a snapshot, "
+        "loaded directly by the next processes while the settings inputs are unchanged. "
+        "Environment variables outside of the <PROJECT>_, DYNACONF_ and DJANGO_ prefixes are "
+        "only part of the inputs when listed in <PROJECT>_SNAPSHOT_EXTRA_ENV."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tests", action="store_true", help="Compile the settings used while running tests.")
+        parser.add_argument("--clear", action="store_true", help="Remove the snapshots.")
+
+    def handle(self, *args, **options):
+        project = settings.SETTINGS_MODULE.rpartition(".")[0]
+        if options["clear"]:
+            import_module(f"{project}.snapshot").remove(settings.BASE_DIR)
+            self.stdout.write("Removed the settings snapshots")
+            return
+
+        env = os.environ.copy()
+        env["DJANGO_SETTINGS_MODULE"] = settings.SETTINGS_MODULE
+        if options["tests"]:
+            # Same detection as IS_RUNNING_TESTS in the settings
+            env["PYTEST_VERSION"] = "compile_settings"
+        else:
+            env.pop("PYTEST_VERSION", None)
+        result = subprocess.run(
+            [sys.executable, "-c", COMPILE_SCRIPT, settings.SETTINGS_MODULE, f"{project}.snapshot"],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed")
+        self.stdout.write(self.style.SUCCESS(result.stdout.strip()))
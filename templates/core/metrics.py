@@ -0,0 +1,86 @@
+"""
+Prometheus metrics of the service.
+
+`MetricsMiddleware` records, for every request, the count, latency, response size and
+number of database queries, labeled by method, status and resolved URL route name.
+Raw paths are never used as labels so the number of series stays bounded by the
+number of routes.
+
+`/metrics/` exposes them in the Prometheus text format. With several worker processes
+(gunicorn, uvicorn workers), set `PROMETHEUS_MULTIPROC_DIR` to a directory shared by the
+workers and emptied on deploy: every worker writes its samples to memory mapped files
+there and the endpoint aggregates them, whichever worker serves the scrape. Workers
+that exit must be marked dead with `prometheus_client.multiprocess.mark_process_dead`
+(e.g. from gunicorn's `child_exit` hook) so their live gauges are dropped.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Methods outside of this set are reported as "other" to bound the label values
+METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+UNRESOLVED_ROUTE = "<unresolved>"
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "Requests served, by route name",
+    ["method", "route", "status"],
+)
+LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent serving requests, by route name",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of the response bodies, by route name",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries run per request, by route name",
+    ["method", "route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+
+
+def route_name(request):
+    """Return the name of the URL pattern that served the request."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return UNRESOLVED_ROUTE
+    # Unnamed patterns fall back to the route, which is still bounded
+    return match.view_name or match.route or UNRESOLVED_ROUTE
+
+
+def observe(request, response, duration, queries):
+    """Record a served request."""
+    method = request.method if request.method in METHODS else "other"
+    route = route_name(request)
+    REQUESTS.labels(method, route, str(response.status_code)).inc()
+    LATENCY.labels(method, route).observe(duration)
+    DB_QUERIES.labels(method, route).observe(queries)
+    if not response.streaming:
+        RESPONSE_SIZE.labels(method, route).observe(len(response.content))
+
+
+def render():
+    """Return the Prometheus text exposition and its content type."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        # Aggregate the samples written by every worker process
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
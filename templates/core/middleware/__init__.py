@@ -1,4 +1,6 @@
 from .api_root_view import APIRootViewMiddleware
+from .metrics import MetricsMiddleware
+from .server_timing import ServerTimingMiddleware
 from .service_prefix import ServicePrefixMiddleware
 
-__all__ = ["ServicePrefixMiddleware", "APIRootViewMiddleware"]
+__all__ = ["ServicePrefixMiddleware", "APIRootViewMiddleware", "MetricsMiddleware", "ServerTimingMiddleware"]
@@ -1,5 +1,6 @@
-from django.urls import get_resolver
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 
+from apps.core.routes import get_route_registry
 from apps.core.views import APIRootView
 
 
@@ -14,46 +15,48 @@ class APIRootViewMiddleware:
     Example:
         - /v2/ would show an index if there are routes under /v2/*
         - /some/deep/path/ would show an index if children exist
+
+    Both sync and async capable, under ASGI only the index fallback (a sync DRF
+    view) runs in a thread.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         response = self.get_response(request)
+        if self._should_serve_index(request, response):
+            return self._serve_index(request)
+        return response
 
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self._should_serve_index(request, response):
+            return await sync_to_async(self._serve_index)(request)
+        return response
+
+    def _should_serve_index(self, request, response):
         # Only intercept 404s for paths ending with /
         is_404_with_trailing_slash = response.status_code == 404 and request.path.endswith("/")
-        if is_404_with_trailing_slash and self._has_child_routes(request.path):
-            # Serve the endpoint index view
-            view = APIRootView.as_view()
-            index_response = view(request)
-            # Render the response if needed (DRF responses need rendering)
-            if hasattr(index_response, "render"):
-                index_response.render()
-            return index_response
-
-        return response
+        return is_404_with_trailing_slash and self._has_child_routes(request.path)
+
+    @staticmethod
+    def _serve_index(request):
+        """Serve the endpoint index view."""
+        view = APIRootView.as_view()
+        index_response = view(request)
+        # Render the response if needed (DRF responses need rendering)
+        if hasattr(index_response, "render"):
+            index_response.render()
+        return index_response
 
     def _has_child_routes(self, path):
         """Check if there are any routes under the given path."""
-        prefix = path.lstrip("/")
-        resolver = get_resolver()
-
-        def check_patterns(patterns, current_path=""):
-            for pattern in patterns:
-                full_path = current_path + str(pattern.pattern)
-
-                # Check if this pattern is under our prefix
-                if full_path.startswith(prefix) and full_path != prefix:
-                    # Found a child route
-                    return True
-
-                # Recurse into includes
-                if hasattr(pattern, "url_patterns"):
-                    if check_patterns(pattern.url_patterns, full_path):
-                        return True
-
-            return False
-
-        return check_patterns(resolver.url_patterns)
+        return get_route_registry().has_children(path)
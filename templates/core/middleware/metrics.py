@@ -0,0 +1,50 @@
+"""
+Metrics middleware.
+
+Records the Prometheus metrics of every request, see `apps.core.metrics`.
+Disabled with METRICS_ENABLED = False.
+"""
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from apps.core import metrics
+from apps.core.queries import QueryCounter
+
+
+class MetricsMiddleware:
+    """
+    Middleware recording request count, latency, response size and database
+    queries, labeled by the resolved URL route name.
+
+    Both sync and async capable.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "METRICS_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        with QueryCounter() as queries:
+            response = self.get_response(request)
+        metrics.observe(request, response, time.perf_counter() - start, queries.count)
+        return response
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        with QueryCounter() as queries:
+            response = await self.get_response(request)
+        metrics.observe(request, response, time.perf_counter() - start, queries.count)
+        return response
@@ -12,6 +12,7 @@ For the /<service-name> case, SCRIPT_NAME is set so reverse()
 generates /<service-name>/... URLs.
 """
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.conf import settings
 from django.urls import set_script_prefix
 
@@ -22,7 +23,31 @@ def _has_prefix(path, prefix):
     Returns True if path equals prefix or starts with prefix followed by '/'.
     This prevents '/metrics-servicefoo' from matching prefix '/metrics-service'.
     """
-    return path == prefix or path.startswith(prefix + "/")
+    return path.startswith(prefix) and (len(path) == len(prefix) or path[len(prefix)] == "/")
+
+
+class _APIServicePrefixRequest:
+    """Request mixin returning the original /api/<service>/... path from get_full_path().
+
+    This ensures DRF templates show correct URLs for forms/links.
+    """
+
+    def get_full_path(self, force_append_slash=False):
+        # Get the canonical path and replace /api/ with /api/<service>/
+        canonical = super().get_full_path(force_append_slash)
+        if canonical.startswith(("/api/", "/api?")):
+            return self._api_service_prefix + canonical[4:]  # len("/api") = 4
+        return canonical
+
+
+class _ServicePrefixRequest:
+    """Request mixin returning the original /<service>/... path from get_full_path().
+
+    Django's get_full_path() doesn't include SCRIPT_NAME.
+    """
+
+    def get_full_path(self, force_append_slash=False):
+        return self._service_prefix + super().get_full_path(force_append_slash)
 
 
 class ServicePrefixMiddleware:
@@ -32,15 +57,41 @@ class ServicePrefixMiddleware:
     Two routing modes:
     1. /api/<service-name>/... → /api/... (no SCRIPT_NAME, canonical URLs)
     2. /<service-name>/... → /... (SCRIPT_NAME set for prefixed URLs)
+
+    Prefixed requests are switched to a subclass of their class (WSGIRequest,
+    ASGIRequest...) overriding get_full_path(), created once per request class,
+    so rewriting a request allocates no closures.
+
+    Both sync and async capable, so ASGI deployments don't switch threads here.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
         # Get service name from ROOT_URLCONF (e.g., "test_service" -> "test-service")
         self.service_name = settings.ROOT_URLCONF.split(".")[0].replace("_", "-")
         self.service_prefix = f"/{self.service_name}"
+        self.api_prefix = f"/api{self.service_prefix}"
+        # Prefixed request classes by original request class, for each mode
+        self._api_request_classes = {}
+        self._service_request_classes = {}
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self._rewrite(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self._rewrite(request)
+        return await self.get_response(request)
+
+    def _rewrite(self, request):
+        """Strip the service prefix from the request path."""
         path = request.path_info
 
         # Handle /api/<service-name>/... → /api/...
@@ -48,33 +99,21 @@ class ServicePrefixMiddleware:
         # Store the API prefix so views can build correct absolute URLs
         # Store original path for DRF breadcrumbs
         # Patch get_full_path to return the original path for templates
-        api_prefix = f"/api{self.service_prefix}"
-        if _has_prefix(path, api_prefix):
+        if _has_prefix(path, self.api_prefix):
             request._original_path = path
-            request._api_service_prefix = api_prefix
-            new_path = "/api" + path[len(api_prefix) :] or "/api/"
+            request._api_service_prefix = self.api_prefix
+            new_path = "/api" + path[len(self.api_prefix) :] or "/api/"
             request.path_info = new_path
             request.path = new_path
             if hasattr(request, "environ"):
                 request.environ["PATH_INFO"] = new_path
-
-            # Patch get_full_path to return the original prefixed path
-            # This ensures DRF templates show correct URLs for forms/links
-            original_get_full_path = request.get_full_path
-
-            def patched_get_full_path(force_append_slash=False):
-                # Get the canonical path and replace /api/ with /api/<service>/
-                canonical = original_get_full_path(force_append_slash)
-                if canonical.startswith(("/api/", "/api?")):
-                    return api_prefix + canonical[4:]  # len("/api") = 4
-                return canonical
-
-            request.get_full_path = patched_get_full_path
+            request.__class__ = self._prefixed_class(request, self._api_request_classes, _APIServicePrefixRequest)
         # Handle /<service-name>/... → /...
         # Set SCRIPT_NAME so reverse() generates /<service-name>/... URLs
         elif _has_prefix(path, self.service_prefix):
             # Store original path for DRF breadcrumbs
             request._original_path = path
+            request._service_prefix = self.service_prefix
             new_path = path[len(self.service_prefix) :] or "/"
             request.path_info = new_path
             request.path = new_path
@@ -83,15 +122,16 @@ class ServicePrefixMiddleware:
             if hasattr(request, "environ"):
                 request.environ["SCRIPT_NAME"] = self.service_prefix
                 request.environ["PATH_INFO"] = new_path
-
             # Patch get_full_path to return the original prefixed path
-            # Django's get_full_path() doesn't include SCRIPT_NAME
-            service_prefix = self.service_prefix
-            original_get_full_path = request.get_full_path
-
-            def patched_get_full_path(force_append_slash=False):
-                return service_prefix + original_get_full_path(force_append_slash)
-
-            request.get_full_path = patched_get_full_path
-
-        return self.get_response(request)
+            request.__class__ = self._prefixed_class(request, self._service_request_classes, _ServicePrefixRequest)
+
+    @staticmethod
+    def _prefixed_class(request, classes, mixin):
+        """Return the subclass of the request's class overriding get_full_path()."""
+        request_class = request.__class__
+        prefixed_class = classes.get(request_class)
+        if prefixed_class is None:
+            if issubclass(request_class, mixin):
+                return request_class
+            prefixed_class = classes[request_class] = type(request_class.__name__, (mixin, request_class), {})
+        return prefixed_class
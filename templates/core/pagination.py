@@ -0,0 +1,122 @@
+"""
+Keyset pagination for large tables.
+
+DRF's `PageNumberPagination` counts the whole queryset and reads every row before the
+requested page (`OFFSET`) on each request, deep pages of large tables take seconds.
+`KeysetPagination` seeks the page from the last row of the previous one instead:
+
+    GET /api/v1/users/
+    {"count": 1204331, "next": "...?cursor=cD0yNQ%3D%3D", "previous": null, "results": [...]}
+
+The cursor is opaque to clients, they follow the `next` and `previous` links. Pages are
+ordered by the `order_by` (or `order`) query parameter of DAB's `OrderByBackend` when
+its first field is an indexed column of the model (primary key, unique or indexed
+field, first field of an index), by the primary key otherwise, so every page is an
+index range scan. The page ordering replaces the one applied by `OrderByBackend`.
+
+The `count` of the response depends on `KEYSET_PAGINATION_COUNT`:
+
+- "estimated": the row estimate of the Postgres query planner, from the table
+  statistics (`pg_class.reltuples`) maintained by `ANALYZE`/autovacuum, no rows are
+  read. Estimates below `EXACT_COUNT_THRESHOLD` rows, and other databases, are
+  counted exactly.
+- "exact": `COUNT(*)`, as `PageNumberPagination` does.
+- "none": no count.
+
+`BaseViewSet` viewsets use it instead of `DEFAULT_PAGINATION_CLASS` when
+`KEYSET_PAGINATION_ENABLED = True`, unless they set their own `pagination_class`.
+"""
+
+import json
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.models import UniqueConstraint
+from rest_framework.pagination import CursorPagination
+
+COUNT_MODES = ("estimated", "exact", "none")
+
+# Query parameters read by DAB's OrderByBackend, the last one given wins
+ORDERING_PARAMS = ("order", "order_by")
+
+# Small results are counted exactly, the estimates are the least accurate there
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+def is_indexed(model, name):
+    """Return whether ``name`` is a non nullable column leading an index of ``model``."""
+    try:
+        field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    # Relations would be compared to their string representation, NULLs are never
+    # greater or lower than the position of a cursor
+    if not field.concrete or field.is_relation or field.null:
+        return False
+    if field.primary_key or field.unique or field.db_index:
+        return True
+    leading = [index.fields[0] for index in model._meta.indexes if index.fields]
+    leading += [fields[0] for fields in model._meta.unique_together]
+    leading += [
+        constraint.fields[0]
+        for constraint in model._meta.constraints
+        if isinstance(constraint, UniqueConstraint) and constraint.fields
+    ]
+    return field.name in (name.lstrip("-") for name in leading)
+
+
+def estimate_count(queryset):
+    """Return the Postgres planner estimate of the rows of ``queryset``, None on other databases."""
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPagination(CursorPagination):
+    """Cursor pagination on an indexed ordering, with an optional estimated count."""
+
+    ordering = "pk"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = self.get_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_ordering(self, request, queryset, view):
+        value = None
+        for key, param in request.query_params.items():
+            if key in ORDERING_PARAMS:
+                value = param
+        field = value.split(",")[0].strip() if value else self.ordering
+        if not is_indexed(queryset.model, field.lstrip("-")):
+            return (self.ordering,)
+        pk = queryset.model._meta.pk
+        if field.lstrip("-") in ("pk", pk.name) or queryset.model._meta.get_field(field.lstrip("-")).unique:
+            return (field,)
+        # Rows sharing a position are told apart by an offset, which needs a stable order
+        return (field, "-pk" if field.startswith("-") else "pk")
+
+    def get_count(self, queryset):
+        mode = settings.KEYSET_PAGINATION_COUNT
+        if mode not in COUNT_MODES:
+            raise ValueError(f"KEYSET_PAGINATION_COUNT must be one of {', '.join(COUNT_MODES)}, not {mode!r}")
+        if mode == "none":
+            return None
+        if mode == "estimated":
+            estimate = estimate_count(queryset)
+            if estimate is not None and estimate >= EXACT_COUNT_THRESHOLD:
+                return estimate
+        return queryset.count()
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count is not None:
+            response.data = {"count": self.count, **response.data}
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        if settings.KEYSET_PAGINATION_COUNT != "none":
+            schema["properties"] = {"count": {"type": "integer", "example": 123}, **schema["properties"]}
+        return schema
@@ -0,0 +1,40 @@
+"""Database query instrumentation shared by the metrics and timing middlewares."""
+
+import time
+
+from django.db import connections
+
+
+class QueryCounter:
+    """
+    Database execute wrapper counting and timing the queries run while installed.
+
+    Usage:
+        with QueryCounter() as queries:
+            ...
+        queries.count, queries.duration
+    """
+
+    __slots__ = ("count", "duration")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+    def __enter__(self):
+        for connection in connections.all():
+            connection.execute_wrappers.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        for connection in connections.all():
+            if self in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self)
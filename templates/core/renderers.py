@@ -1,7 +1,13 @@
 """Custom DRF renderers for the core app."""
 
-from rest_framework.renderers import BrowsableAPIRenderer
-from rest_framework.utils.breadcrumbs import get_breadcrumbs
+import csv
+import io
+import json
+
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.core.routes import get_route_registry
 
 
 class ServiceBrowsableAPIRenderer(BrowsableAPIRenderer):
@@ -15,17 +21,21 @@ class ServiceBrowsableAPIRenderer(BrowsableAPIRenderer):
     For the /api/<service>/... case, we generate breadcrumbs using the
     rewritten path (/api/...) and then fix up the URLs to include the
     service prefix.
+
+    Breadcrumbs are resolved through the shared route registry, which skips the
+    ancestors that have no route instead of resolving each of them.
     """
 
     def get_breadcrumbs(self, request):
         # Check for API service prefix (set by ServicePrefixMiddleware for /api/<service>/...)
         api_service_prefix = getattr(request, "_api_service_prefix", None)
+        registry = get_route_registry()
 
         if api_service_prefix:
             # For /api/<service>/... URLs:
             # 1. Generate breadcrumbs using the rewritten path (/api/...)
             # 2. Fix up URLs to include the service prefix
-            breadcrumbs = get_breadcrumbs(request.path, request)
+            breadcrumbs = registry.breadcrumbs(request.path, request)
 
             # Replace /api/ with /api/<service>/ in all breadcrumb URLs
             fixed_breadcrumbs = []
@@ -37,4 +47,51 @@ class ServiceBrowsableAPIRenderer(BrowsableAPIRenderer):
 
         # For /<service>/... URLs, use original path (SCRIPT_NAME handles the rest)
         path = getattr(request, "_original_path", request.path)
-        return get_breadcrumbs(path, request)
+        return registry.breadcrumbs(path, request)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Render a list of rows as newline delimited JSON, one document per line.
+
+    Chunks of an export can be rendered separately and concatenated.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = [data] if isinstance(data, dict) else data
+        return "".join(json.dumps(row, cls=JSONEncoder, ensure_ascii=False) + "\n" for row in rows).encode()
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Render a list of rows as CSV, nested values are encoded as JSON.
+
+    The renderer context may give the `fields` (columns, the keys of the first row
+    by default) and `header` (False to render the following chunks of an export).
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        rows = [data] if isinstance(data, dict) else data
+        fields = renderer_context.get("fields") or (list(rows[0]) if rows else [])
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fields, extrasaction="ignore")
+        if renderer_context.get("header", True):
+            writer.writeheader()
+        for row in rows:
+            writer.writerow({key: self._cell(value) for key, value in row.items()})
+        return buffer.getvalue().encode()
+
+    @staticmethod
+    def _cell(value):
+        if isinstance(value, dict | list):
+            return json.dumps(value, cls=JSONEncoder, ensure_ascii=False)
+        return value
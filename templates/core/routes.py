@@ -0,0 +1,207 @@
+"""
+Route introspection registry for the core app.
+
+The APIRootViewMiddleware, the APIRootView and the breadcrumbs of the browsable API
+all need to know which routes exist under a path. Instead of walking the URL resolver
+on every request, the URL configuration is walked once per worker into an immutable
+tree of path segments, which serves all of them.
+
+The tree is built on first use (after app loading, URLconfs import views and models)
+and rebuilt when Django builds a new resolver, e.g. after `clear_url_caches()` or a
+ROOT_URLCONF override in tests.
+"""
+
+import re
+from types import MappingProxyType
+
+from django.contrib.admindocs.views import simplify_regex
+from django.urls import URLPattern, URLResolver, get_resolver, get_script_prefix
+from django.urls.exceptions import Resolver404
+from rest_framework.reverse import preserve_builtin_query_params
+
+# Segments made of these characters only match themselves
+_LITERAL_SEGMENT = re.compile(r"[\w.~-]+")
+
+
+class RouteNode:
+    """
+    A path segment of the URL configuration.
+
+    Attributes:
+        children: Child nodes by segment, in URL resolver traversal order
+        index: Direct children listed by the API root views, sorted ``(segment,
+            pattern names)`` tuples where the names are those of every pattern under
+            the segment so a view can exclude itself
+        endpoint: A URL pattern ends at this node
+        wildcard: A child segment is not a literal (converter or regex) and may match
+            any path below this node
+    """
+
+    __slots__ = ("children", "index", "endpoint", "wildcard")
+
+    def __init__(self, children, index, endpoint, wildcard):
+        self.children = children
+        self.index = index
+        self.endpoint = endpoint
+        self.wildcard = wildcard
+
+
+class _NodeBuilder:
+    """Mutable node used while walking the URL configuration."""
+
+    __slots__ = ("children", "names", "endpoint")
+
+    def __init__(self):
+        self.children = {}
+        self.names = set()
+        self.endpoint = False
+
+    def freeze(self):
+        children = {segment: child.freeze() for segment, child in self.children.items()}
+        index = tuple(
+            (segment, frozenset(child.names))
+            for segment, child in sorted(self.children.items())
+            # Skip internal paths (debug toolbar...) and parameters like <pk>
+            if child.names and not segment.startswith("_") and "<" not in segment
+        )
+        wildcard = any(not _LITERAL_SEGMENT.fullmatch(segment) for segment in children)
+        return RouteNode(MappingProxyType(children), index, self.endpoint, wildcard)
+
+
+def _split(path):
+    return [segment for segment in path.split("/") if segment]
+
+
+class RouteRegistry:
+    """Immutable route tree of a URL resolver."""
+
+    __slots__ = ("resolver", "root", "_view_names")
+
+    def __init__(self, resolver):
+        self.resolver = resolver
+        root = _NodeBuilder()
+        for clean_path, pattern_name, is_endpoint in self._extract_patterns(resolver.url_patterns, ""):
+            segments = _split(clean_path)
+            node = root
+            for depth, segment in enumerate(segments):
+                node = node.children.setdefault(segment, _NodeBuilder())
+                # Patterns count for the API root index of every ancestor, unless they
+                # are index views or debug paths relative to that ancestor
+                if not self._is_index(pattern_name) and "__debug__" not in "/".join(segments[depth:]):
+                    node.names.add(pattern_name)
+            node.endpoint = node.endpoint or is_endpoint
+        self.root = root.freeze()
+        self._view_names = {}
+
+    @staticmethod
+    def _is_index(pattern_name):
+        return bool(pattern_name) and (pattern_name.endswith("-index") or pattern_name == "api-root")
+
+    @classmethod
+    def _extract_patterns(cls, patterns, current_path):
+        """
+        Recursively extract URL patterns in traversal order.
+        Yields (clean_path, pattern_name, is_endpoint) tuples.
+        """
+        for pattern in patterns:
+            raw_path = current_path + str(pattern.pattern)
+            clean_path = simplify_regex(raw_path)
+
+            if isinstance(pattern, URLResolver):
+                # Yield the resolver path itself (for section detection)
+                yield (clean_path, None, False)
+                # Recurse into nested patterns
+                yield from cls._extract_patterns(pattern.url_patterns, raw_path)
+            elif isinstance(pattern, URLPattern):
+                # Yield leaf pattern with its name
+                yield (clean_path, pattern.name, True)
+
+    def find(self, path):
+        """Return the node of a literal path, None when no route goes through it."""
+        node = self.root
+        for segment in _split(path):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def has_children(self, path):
+        """Check if there are any routes under the given path."""
+        node = self.find(path)
+        return node is not None and bool(node.children)
+
+    def children(self, prefix):
+        """Return the API root index of ``prefix``, see `RouteNode.index`."""
+        node = self.find(prefix)
+        return node.index if node is not None else ()
+
+    def could_resolve(self, path):
+        """
+        Tell if ``path`` may resolve to a URL pattern.
+
+        False is definitive, True may still fail to resolve: as soon as a converter or
+        regex segment is met the resolver has to decide.
+        """
+        node = self.root
+        for segment in _split(path):
+            if node.wildcard:
+                return True
+            node = node.children.get(segment)
+            if node is None:
+                return False
+        return node.endpoint or node.wildcard
+
+    def breadcrumbs(self, url, request=None):
+        """
+        Same as `rest_framework.utils.breadcrumbs.get_breadcrumbs`.
+
+        Ancestors with no route are skipped without calling the resolver, and view
+        names are computed once per view.
+        """
+        prefix = get_script_prefix().rstrip("/")
+        url = url[len(prefix) :]
+        breadcrumbs = []
+        last_view = None
+        while True:
+            view = self._resolve_api_view(url)
+            if view is not None and view != last_view:
+                breadcrumbs.insert(0, (self._view_name(view), preserve_builtin_query_params(prefix + url, request)))
+                last_view = view
+            if url == "":
+                return breadcrumbs
+            url = url.rstrip("/") if url.endswith("/") else url[: url.rfind("/") + 1]
+
+    def _resolve_api_view(self, url):
+        """Return the DRF view serving ``url``, None when it does not resolve to one."""
+        # Imported here as DRF's get_breadcrumbs does, rest_framework.views imports the
+        # renderers, which import this module
+        from rest_framework.views import APIView
+
+        if not self.could_resolve(url):
+            return None
+        try:
+            view = self.resolver.resolve(url).func
+        except Resolver404:
+            return None
+        cls = getattr(view, "cls", None)
+        if cls is None or not issubclass(cls, APIView):
+            return None
+        return view
+
+    def _view_name(self, view):
+        if view not in self._view_names:
+            self._view_names[view] = view.cls(**getattr(view, "initkwargs", {})).get_view_name()
+        return self._view_names[view]
+
+
+_registry = None
+
+
+def get_route_registry():
+    """Return the route registry of the current URL resolver, built once per resolver."""
+    global _registry
+    resolver = get_resolver()
+    registry = _registry
+    if registry is None or registry.resolver is not resolver:
+        registry = _registry = RouteRegistry(resolver)
+    return registry
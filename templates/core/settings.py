@@ -32,13 +32,73 @@ REST_FRAMEWORK__DEFAULT_RENDERER_CLASSES = [
     "apps.core.renderers.ServiceBrowsableAPIRenderer",
 ]
 
-# Middleware - ServicePrefix at start, APIRootView at end
+# Middleware - ServerTiming and ServicePrefix at start, APIRootView at end
 MIDDLEWARE = [
     "dynaconf_merge_unique",
+    "apps.core.middleware.ServerTimingMiddleware",
     "apps.core.middleware.ServicePrefixMiddleware",
+    "apps.core.middleware.MetricsMiddleware",
     "apps.core.middleware.APIRootViewMiddleware",
 ]
 
+# Prometheus metrics served at /metrics/ - see apps/core/metrics.py
+# Set PROMETHEUS_MULTIPROC_DIR when running several worker processes
+METRICS_ENABLED = True
+
+# Server-Timing header and timing log line - see apps/core/middleware/server_timing.py
+SERVER_TIMING_ENABLED = False
+# Fraction of the requests instrumented, from 0 to 1
+SERVER_TIMING_SAMPLE_RATE = 1.0
+
+# Health checks - see apps/core/health.py
+# Seconds a check may run before it is reported as failed
+HEALTH_CHECK_TIMEOUT = 2.0
+# Seconds a health report is served from cache to concurrent and repeated probes
+HEALTH_CHECK_CACHE_TTL = 5.0
+
+# Keyset pagination for BaseViewSet viewsets - see apps/core/pagination.py
+KEYSET_PAGINATION_ENABLED = False
+# Count of the keyset pages: "estimated" (Postgres planner statistics), "exact" or "none"
+KEYSET_PAGINATION_COUNT = "estimated"
+
+# Query parameters DAB's FieldLookupBackend doesn't read as field lookups: DAB's
+# defaults (only applied when unset) and the `cursor` of the keyset pages
+ANSIBLE_BASE_REST_FILTERS_RESERVED_NAMES = [
+    "page",
+    "page_size",
+    "format",
+    "order",
+    "order_by",
+    "search",
+    "type",
+    "host_filter",
+    "count_disabled",
+    "no_truncate",
+    "limit",
+    "validate",
+    "user_ansible_id",
+    "team_ansible_id",
+    "object_ansible_id",
+    "assignment",
+    "cursor",
+]
+
+# Maximum number of items of the bulk endpoints (<resource>/bulk/) of BaseViewSet viewsets
+BULK_MAX_ITEMS = 1000
+
+# Rows read, serialized and sent at a time by the exports (<resource>/export/)
+EXPORT_CHUNK_SIZE = 2000
+
+# Cached RBAC visibility of the list endpoints - see apps/core/visibility.py
+# Use a cache alias shared by the worker processes when enabling it
+RBAC_VISIBILITY_CACHE_ENABLED = False
+RBAC_VISIBILITY_CACHE_ALIAS = "default"
+# Seconds before cached visibility is evaluated again, for changes sending no signals
+RBAC_VISIBILITY_CACHE_TTL = 300
+# Users seeing more objects than this are filtered on the subquery, longer lists of
+# keys cost the database more than the subquery
+RBAC_VISIBILITY_CACHE_MAX_IDS = 200
+
 # Default RBAC roles - created automatically on `python manage.py migrate`
 ANSIBLE_BASE_MANAGED_ROLE_REGISTRY = {
     "sys_auditor": {"name": "Platform Auditor"},  # View-only, system-wide
@@ -0,0 +1,40 @@
+"""
+Throughput benchmarks for the hot paths of the core app.
+
+Benchmarks are skipped unless `RUN_BENCHMARKS` is set, they print the rate of each
+variant so changes can be compared on the same machine:
+
+    RUN_BENCHMARKS=1 uv run pytest apps/core/tests/benchmarks
+"""
+
+import os
+import time
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmarks" in item.nodeid:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def throughput():
+    """Call a function repeatedly for a while and return (and print) calls per second."""
+
+    def run(label, func, duration=1.0):
+        func()  # Warm up
+        calls = 0
+        start = time.perf_counter()
+        while (elapsed := time.perf_counter() - start) < duration:
+            func()
+            calls += 1
+        rate = calls / elapsed
+        print(f"\n{label}: {rate:,.0f}/s")
+        return rate
+
+    return run
@@ -0,0 +1,23 @@
+"""Requests per second served by the API root views."""
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.core import routes
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", ["/", "/api/", "/api/v1/"])
+def test_api_root_requests_per_second(path, throughput):
+    client = APIClient()
+    assert client.get(path).status_code == status.HTTP_200_OK
+
+    def uncached():
+        # Walk the URLconf on every request, as before the route registry
+        routes._registry = None
+        client.get(path)
+
+    before = throughput(f"{path} without route registry", uncached)
+    after = throughput(f"{path} with route registry", lambda: client.get(path))
+    assert after > before
@@ -0,0 +1,39 @@
+"""List latency of a user holding many role assignments, with and without the visibility cache."""
+
+import pytest
+from ansible_base.rbac import permission_registry
+from ansible_base.rbac.models import RoleDefinition
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.core.models import Organization
+
+# Below RBAC_VISIBILITY_CACHE_MAX_IDS, larger sets are filtered on the subquery either way
+ASSIGNMENTS = 100
+
+
+@pytest.fixture
+def client(db):
+    permission_registry.create_managed_roles(apps)
+    user = get_user_model().objects.create(username="many-roles")
+    org_admin = RoleDefinition.objects.get(name="Organization Admin")
+    for i in range(ASSIGNMENTS):
+        org_admin.give_permission(user, Organization.objects.create(name=f"org-{i}"))
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.parametrize("endpoint", ["/api/v1/organizations/", "/api/v1/teams/", "/api/v1/users/"])
+def test_visibility_cache(endpoint, client, settings, throughput):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+    def list_objects():
+        assert client.get(endpoint).status_code == 200
+
+    settings.RBAC_VISIBILITY_CACHE_ENABLED = False
+    uncached = throughput(f"{endpoint} uncached", list_objects)
+    settings.RBAC_VISIBILITY_CACHE_ENABLED = True
+    cached = throughput(f"{endpoint} cached", list_objects)
+    assert cached >= uncached
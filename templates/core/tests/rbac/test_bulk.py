@@ -0,0 +1,113 @@
+"""Tests for the bulk endpoints of the core viewsets."""
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from apps.core.models import Organization, Team
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestBulkCreate:
+    def test_creates_every_item(self, admin_api_client):
+        r = admin_api_client.post('/api/v1/organizations/bulk/', [{'name': 'Org A'}, {'name': 'Org B'}], format='json')
+        assert r.status_code == 201
+        assert [org['name'] for org in r.data] == ['Org A', 'Org B']
+        assert Organization.objects.filter(name__in=['Org A', 'Org B']).count() == 2
+
+    def test_errors_per_item_and_nothing_created(self, admin_api_client):
+        r = admin_api_client.post('/api/v1/organizations/bulk/', [{'name': 'Org A'}, {}], format='json')
+        assert r.status_code == 400
+        assert r.data['errors'][0] == {}
+        assert 'name' in r.data['errors'][1]
+        assert not Organization.objects.filter(name='Org A').exists()
+
+    def test_constraint_violation_within_batch(self, admin_api_client):
+        r = admin_api_client.post('/api/v1/organizations/bulk/', [{'name': 'Org A'}, {'name': 'Org A'}], format='json')
+        assert r.status_code == 400
+        assert r.data['errors'][0] == {}
+        assert r.data['errors'][1]
+        assert not Organization.objects.filter(name='Org A').exists()
+
+    def test_permission_checked_per_parent(self, user_api_client, rando, organization, org_admin_rd):
+        other = Organization.objects.create(name='Other Org')
+        org_admin_rd.give_permission(rando, organization)
+        items = [
+            {'name': 'Team A', 'organization': organization.id},
+            {'name': 'Team B', 'organization': other.id},
+        ]
+        r = user_api_client.post('/api/v1/teams/bulk/', items, format='json')
+        assert r.status_code == 403
+        assert r.data['errors'][0] == {}
+        assert r.data['errors'][1]
+        r = user_api_client.post('/api/v1/teams/bulk/', items[:1], format='json')
+        assert r.status_code == 201
+
+    def test_user_passwords_are_hashed(self, admin_api_client):
+        items = [{'username': f'bulk-{i}', 'password': f'password-{i}'} for i in range(3)]
+        r = admin_api_client.post('/api/v1/users/bulk/', items, format='json')
+        assert r.status_code == 201
+        for i in range(3):
+            user = User.objects.get(username=f'bulk-{i}')
+            assert user.check_password(f'password-{i}')
+            assert 'password' not in r.data[i]
+
+    def test_payload_must_be_a_list(self, admin_api_client, settings):
+        assert admin_api_client.post('/api/v1/organizations/bulk/', {'name': 'Org'}, format='json').status_code == 400
+        settings.BULK_MAX_ITEMS = 1
+        r = admin_api_client.post('/api/v1/organizations/bulk/', [{'name': 'A'}, {'name': 'B'}], format='json')
+        assert r.status_code == 400
+
+
+@pytest.mark.django_db
+class TestBulkUpdate:
+    def test_updates_every_item(self, admin_api_client, organization):
+        other = Organization.objects.create(name='Other Org')
+        items = [{'id': organization.id, 'description': 'one'}, {'id': other.id, 'description': 'two'}]
+        r = admin_api_client.patch('/api/v1/organizations/bulk/', items, format='json')
+        assert r.status_code == 200
+        organization.refresh_from_db()
+        other.refresh_from_db()
+        assert (organization.description, other.description) == ('one', 'two')
+
+    def test_unknown_id(self, admin_api_client, organization):
+        items = [{'id': organization.id, 'description': 'one'}, {'id': 0, 'description': 'two'}]
+        r = admin_api_client.patch('/api/v1/organizations/bulk/', items, format='json')
+        assert r.status_code == 400
+        assert r.data['errors'][1] == {'id': ['Not found.']}
+        organization.refresh_from_db()
+        assert organization.description != 'one'
+
+    def test_denied_objects(self, user_api_client, rando, team, team_admin_rd, team_member_rd, organization):
+        other = Team.objects.create(name='Other Team', organization=organization)
+        team_admin_rd.give_permission(rando, team)
+        team_member_rd.give_permission(rando, other)
+        items = [{'id': team.id, 'description': 'one'}, {'id': other.id, 'description': 'two'}]
+        r = user_api_client.patch('/api/v1/teams/bulk/', items, format='json')
+        assert r.status_code == 403
+        assert r.data['errors'][0] == {}
+        assert r.data['errors'][1]
+
+    def test_user_password(self, admin_api_client, rando):
+        r = admin_api_client.patch('/api/v1/users/bulk/', [{'id': rando.id, 'password': 'new-password'}], format='json')
+        assert r.status_code == 200
+        rando.refresh_from_db()
+        assert rando.check_password('new-password')
+
+
+@pytest.mark.django_db
+class TestBulkDestroy:
+    def test_deletes_every_item(self, admin_api_client, organization):
+        other = Organization.objects.create(name='Other Org')
+        r = admin_api_client.delete('/api/v1/organizations/bulk/', [organization.id, other.id], format='json')
+        assert r.status_code == 204
+        assert not Organization.objects.filter(id__in=[organization.id, other.id]).exists()
+
+    def test_invisible_objects_are_not_found(self, user_api_client, rando, organization, org_admin_rd):
+        other = Organization.objects.create(name='Other Org')
+        org_admin_rd.give_permission(rando, organization)
+        r = user_api_client.delete('/api/v1/organizations/bulk/', [organization.id, other.id], format='json')
+        assert r.status_code == 400
+        assert r.data['errors'] == [{}, {'id': ['Not found.']}]
+        assert Organization.objects.filter(id__in=[organization.id, other.id]).count() == 2
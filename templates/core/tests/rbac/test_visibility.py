@@ -0,0 +1,99 @@
+"""Tests for the cached RBAC visibility of the list endpoints."""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+
+from apps.core import visibility
+from apps.core.models import Organization, Team
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def visibility_cache(settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    settings.RBAC_VISIBILITY_CACHE_ENABLED = True
+    # Keys of the previous tests would match the primary keys reused by this one
+    caches["default"].clear()
+
+
+def names(client, endpoint, key='name'):
+    r = client.get(endpoint)
+    assert r.status_code == 200
+    return sorted(result[key] for result in r.data['results'])
+
+
+@pytest.mark.django_db
+class TestVisibilityCache:
+    def test_subquery_evaluated_once(self, rando, organization, org_admin_rd):
+        org_admin_rd.give_permission(rando, organization)
+        access_qs = mock.Mock(wraps=Organization.access_qs)
+        for _ in range(3):
+            queryset = visibility.filter_visible(rando, Organization.objects.all(), access_qs)
+            assert list(queryset) == [organization]
+        assert access_qs.call_count == 1
+
+    def test_role_given_and_removed(self, user_api_client, rando, organization, org_admin_rd):
+        assert names(user_api_client, '/api/v1/organizations/') == []
+        org_admin_rd.give_permission(rando, organization)
+        assert names(user_api_client, '/api/v1/organizations/') == ['Test Org']
+        org_admin_rd.remove_permission(rando, organization)
+        assert names(user_api_client, '/api/v1/organizations/') == []
+
+    def test_object_created(self, user_api_client, rando, organization, team, org_admin_rd):
+        org_admin_rd.give_permission(rando, organization)
+        assert names(user_api_client, '/api/v1/teams/') == ['Test Team']
+        Team.objects.create(name='Other Team', organization=organization)
+        assert names(user_api_client, '/api/v1/teams/') == ['Other Team', 'Test Team']
+
+    def test_object_moved(self, user_api_client, rando, organization, team, org_admin_rd):
+        other = Organization.objects.create(name='Other Org')
+        org_admin_rd.give_permission(rando, organization)
+        assert names(user_api_client, '/api/v1/teams/') == ['Test Team']
+        team.organization = other
+        team.save()
+        assert names(user_api_client, '/api/v1/teams/') == []
+
+    def test_unrelated_saves_keep_the_cache(self, rando, organization, team, org_admin_rd):
+        org_admin_rd.give_permission(rando, organization)
+        version = visibility._versions(visibility._cache(), [visibility._GLOBAL_VERSION_KEY])
+        Organization.objects.create(name='Other Org')
+        organization.description = 'changed'
+        organization.save()
+        team.name = 'Renamed Team'
+        team.save()
+        rando.save(update_fields=['last_login'])
+        assert visibility._versions(visibility._cache(), [visibility._GLOBAL_VERSION_KEY]) == version
+
+    def test_member_added(self, user_api_client, rando, organization, org_member_rd):
+        other = User.objects.create(username='other')
+        org_member_rd.give_permission(rando, organization)
+        assert 'other' not in names(user_api_client, '/api/v1/users/', key='username')
+        # Visible to the other members of the organization
+        org_member_rd.give_permission(other, organization)
+        assert 'other' in names(user_api_client, '/api/v1/users/', key='username')
+
+    def test_superuser_created(self, user_api_client, rando, organization, org_member_rd):
+        org_member_rd.give_permission(rando, organization)
+        assert 'root' not in names(user_api_client, '/api/v1/users/', key='username')
+        User.objects.create_superuser(username='root', password='password', email='root@test.com')
+        assert 'root' in names(user_api_client, '/api/v1/users/', key='username')
+
+    def test_too_many_ids_not_cached(self, settings, rando, organization, org_admin_rd):
+        settings.RBAC_VISIBILITY_CACHE_MAX_IDS = 0
+        org_admin_rd.give_permission(rando, organization)
+        access_qs = mock.Mock(wraps=Organization.access_qs)
+        for _ in range(2):
+            assert list(visibility.filter_visible(rando, Organization.objects.all(), access_qs)) == [organization]
+        # Once to find out there are too many, then on the subquery
+        assert access_qs.call_count == 3
+
+    def test_disabled(self, settings, rando, organization):
+        settings.RBAC_VISIBILITY_CACHE_ENABLED = False
+        access_qs = mock.Mock(wraps=Organization.access_qs)
+        visibility.filter_visible(rando, Organization.objects.all(), access_qs)
+        visibility.filter_visible(rando, Organization.objects.all(), access_qs)
+        assert access_qs.call_count == 2
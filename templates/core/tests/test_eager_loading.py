@@ -0,0 +1,94 @@
+"""Tests for the eager loading plans of BaseViewSet viewsets."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from apps.core.eager_loading import QueryPlan, plan
+from apps.core.models import Organization, Team
+from apps.core.tests.utils import assert_constant_list_queries
+from apps.core.v1.serializers import TeamSerializer
+
+User = get_user_model()
+
+
+class TeamNameSerializer(serializers.ModelSerializer):
+    organization_name = serializers.CharField(source="organization.name")
+
+    class Meta:
+        model = Team
+        fields = ["id", "name", "organization_name"]
+
+
+class OrganizationTeamsSerializer(serializers.ModelSerializer):
+    teams = TeamNameSerializer(many=True)
+
+    class Meta:
+        model = Organization
+        fields = ["id", "name", "teams"]
+
+
+class TestQueryPlan(TestCase):
+    def test_foreign_keys_are_joined(self):
+        query_plan = plan(TeamSerializer())
+        self.assertIn("organization", query_plan.select_related)
+        # Method fields may read any column
+        self.assertIsNone(query_plan.only)
+
+    def test_only_serialized_columns(self):
+        query_plan = plan(TeamNameSerializer())
+        self.assertEqual(query_plan.select_related, ("organization",))
+        self.assertEqual(query_plan.only, ("id", "name", "organization"))
+
+    def test_nested_reverse_relation_is_prefetched(self):
+        query_plan = plan(OrganizationTeamsSerializer(many=True))
+        self.assertEqual(query_plan.select_related, ())
+        self.assertEqual(query_plan.prefetch_related, ("teams", "teams__organization"))
+        self.assertEqual(query_plan.only, ("id", "name"))
+
+    def test_extend(self):
+        query_plan = QueryPlan(select_related=("organization",), only=("id", "organization")).extend(
+            select_related=["created_by__created_by"], prefetch_related=["users"]
+        )
+        self.assertEqual(query_plan.select_related, ("organization", "created_by__created_by"))
+        self.assertEqual(query_plan.prefetch_related, ("users",))
+        self.assertEqual(query_plan.only, ("id", "organization", "created_by"))
+
+    def test_planned_queryset(self):
+        organization = Organization.objects.create(name="org")
+        for i in range(3):
+            Team.objects.create(name=f"team-{i}", organization=organization)
+        queryset = plan(OrganizationTeamsSerializer()).apply(Organization.objects.all())
+        with CaptureQueriesContext(connection) as queries:
+            data = OrganizationTeamsSerializer(queryset, many=True).data
+        # Organizations, teams and at most the organizations of the teams
+        self.assertLessEqual(len(queries), 3)
+        self.assertEqual([team["organization_name"] for team in data[0]["teams"]], ["org"] * 3)
+
+
+class TestListQueries(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(username="admin", password="password", email="admin@test.com")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_organizations(self):
+        assert_constant_list_queries(
+            self.client, "/api/v1/organizations/", lambda i: Organization.objects.create(name=f"org-{i}")
+        )
+
+    def test_teams(self):
+        def create(i):
+            organization = Organization.objects.create(name=f"org-{i}", created_by=self.admin)
+            Team.objects.create(name=f"team-{i}", organization=organization, created_by=self.admin)
+
+        assert_constant_list_queries(self.client, "/api/v1/teams/", create)
+
+    def test_users(self):
+        assert_constant_list_queries(self.client, "/api/v1/users/", lambda i: User.objects.create(username=f"user-{i}"))
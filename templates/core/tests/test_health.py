@@ -24,3 +24,89 @@ class TestHealthEndpoint(TestCase):
         self.assertEqual(data["status"], "healthy")
         self.assertIn("database", data["checks"])
         self.assertEqual(data["checks"]["database"], "ok")
+
+
+class TestProbeEndpoints(TestCase):
+    def setUp(self):
+        from apps.core import health
+
+        self.client = APIClient()
+        self.health = health
+        health.clear_cache()
+
+    def tearDown(self):
+        for name in ("failing", "optional", "slow", "counted", "alive"):
+            self.health.unregister(name)
+
+    def test_livez_runs_no_dependency_checks(self):
+        response = self.client.get("/livez/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"status": "healthy", "checks": {}})
+
+    def test_livez_runs_liveness_checks(self):
+        self.health.register("alive", lambda: None, probes=[self.health.LIVENESS])
+        response = self.client.get("/livez/")
+        self.assertEqual(response.json()["checks"], {"alive": "ok"})
+        self.assertNotIn("alive", self.client.get("/readyz/").json()["checks"])
+
+    def test_readyz_returns_healthy(self):
+        response = self.client.get("/readyz/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["status"], "healthy")
+        for name in ("database", "migrations"):
+            self.assertEqual(data["checks"][name], "ok")
+        self.assertEqual(response["Cache-Control"], "no-store")
+
+    def test_cache_check_skipped_for_dummy_cache(self):
+        # The test settings use DummyCache, which can't pass a write and read back
+        self.assertNotIn("cache", self.client.get("/readyz/").json()["checks"])
+
+    def test_readyz_critical_failure(self):
+        @self.health.register("failing")
+        def failing():
+            raise RuntimeError("down")
+
+        response = self.client.get("/readyz/")
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        data = response.json()
+        self.assertEqual(data["status"], "unhealthy")
+        self.assertEqual(data["checks"]["failing"], "error: down")
+
+    def test_readyz_non_critical_failure(self):
+        def optional():
+            raise RuntimeError("down")
+
+        self.health.register("optional", optional, critical=False)
+        response = self.client.get("/readyz/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["checks"]["optional"], "error: down")
+
+    def test_check_timeout(self):
+        import threading
+
+        release = threading.Event()
+        self.health.register("slow", lambda: release.wait(5), timeout=0.05)
+        try:
+            report = self.health.run_checks(self.health.READINESS)
+        finally:
+            release.set()
+        self.assertFalse(report.healthy)
+        self.assertEqual(report.to_dict()["checks"]["slow"], "error: timed out after 0.05s")
+
+    def test_reports_cached_for_ttl(self):
+        calls = []
+        self.health.register("counted", lambda: calls.append(1))
+
+        with self.settings(HEALTH_CHECK_CACHE_TTL=60):
+            self.health.run_checks(self.health.READINESS)
+            self.health.run_checks(self.health.READINESS)
+        self.assertEqual(len(calls), 1)
+
+        with self.settings(HEALTH_CHECK_CACHE_TTL=0):
+            self.health.run_checks(self.health.READINESS)
+        self.assertEqual(len(calls), 2)
+
+    def test_register_unknown_probe(self):
+        with self.assertRaises(ValueError):
+            self.health.register("failing", lambda: None, probes=["startup"])
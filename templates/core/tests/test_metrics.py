@@ -0,0 +1,54 @@
+"""Tests for the Prometheus metrics middleware and endpoint."""
+
+from django.db import connection
+from django.test import TestCase
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetrics(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_requests_labeled_by_route_name(self):
+        before = sample("http_requests_total", method="GET", route="ping", status="200")
+        self.client.get("/ping/")
+        after = sample("http_requests_total", method="GET", route="ping", status="200")
+        self.assertEqual(after, before + 1)
+        self.assertGreater(sample("http_request_duration_seconds_count", method="GET", route="ping"), 0)
+        self.assertGreater(sample("http_response_size_bytes_sum", method="GET", route="ping"), 0)
+
+    def test_unresolved_paths_share_a_label(self):
+        before = sample("http_requests_total", method="GET", route="<unresolved>", status="404")
+        self.client.get("/not/a/route")
+        self.client.get("/not/a/route/either")
+        after = sample("http_requests_total", method="GET", route="<unresolved>", status="404")
+        self.assertEqual(after, before + 2)
+
+    def test_unknown_methods_share_a_label(self):
+        before = sample("http_requests_total", method="other", route="ping", status="405")
+        self.client.generic("BREW", "/ping/")
+        self.assertEqual(sample("http_requests_total", method="other", route="ping", status="405"), before + 1)
+
+    def test_query_counter(self):
+        from apps.core.queries import QueryCounter
+
+        with QueryCounter() as queries:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.execute("SELECT 2")
+        self.assertEqual(queries.count, 2)
+        self.assertGreater(queries.duration, 0)
+        self.assertNotIn(queries, connection.execute_wrappers)
+
+    def test_metrics_endpoint(self):
+        self.client.get("/ping/")
+        response = self.client.get("/metrics/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(b'http_requests_total{method="GET",route="ping",status="200"}', response.content)
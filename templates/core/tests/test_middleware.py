@@ -112,6 +112,49 @@ class TestServicePrefixMiddleware(TestCase):
         response = self.client.get(f"/api/{self.service_name}extra/v1/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_prefixed_request_get_full_path(self):
+        """get_full_path() returns the original prefixed path without patching the instance."""
+        from django.test import RequestFactory
+
+        from apps.core.middleware import ServicePrefixMiddleware
+
+        requests = []
+        middleware = ServicePrefixMiddleware(requests.append)
+        factory = RequestFactory()
+
+        middleware(factory.get(f"/{self.service_name}/ping/", {"a": "1"}))
+        middleware(factory.get(f"/api/{self.service_name}/v1/", {"a": "1"}))
+        middleware(factory.get(f"/{self.service_name}/api/v1/"))
+        service_request, api_request, other_request = requests
+
+        self.assertEqual(service_request.path, "/ping/")
+        self.assertEqual(service_request.get_full_path(), f"/{self.service_name}/ping/?a=1")
+        self.assertEqual(api_request.path, "/api/v1/")
+        self.assertEqual(api_request.get_full_path(), f"/api/{self.service_name}/v1/?a=1")
+        self.assertNotIn("get_full_path", vars(service_request))
+        # The prefixed request class is created once per request class
+        self.assertIs(type(other_request), type(service_request))
+
+    def test_async_capable(self):
+        """The middleware runs in the event loop when the next handler is async."""
+        from asgiref.sync import iscoroutinefunction
+
+        from apps.core.middleware import ServicePrefixMiddleware
+
+        async def get_response(request):
+            return request
+
+        self.assertTrue(iscoroutinefunction(ServicePrefixMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(ServicePrefixMiddleware(lambda request: request)))
+
+    async def test_async_request_with_service_prefix_routes_to_root(self):
+        """/<service-name>/ping/ routes to /ping/ under ASGI."""
+        from django.test import AsyncClient
+
+        response = await AsyncClient().get(f"/{self.service_name}/ping/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"ping": "pong"})
+
 
 class TestAPIRootViewMiddleware(TestCase):
     def setUp(self):
@@ -136,6 +179,34 @@ class TestAPIRootViewMiddleware(TestCase):
         response = self.client.get("/completely/fake/path/with/no/children/")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_has_child_routes(self):
+        from apps.core.middleware import APIRootViewMiddleware
+
+        middleware = APIRootViewMiddleware(lambda request: None)
+        self.assertTrue(middleware._has_child_routes("/"))
+        self.assertTrue(middleware._has_child_routes("/api/"))
+        self.assertTrue(middleware._has_child_routes("/api/v1/"))
+        self.assertFalse(middleware._has_child_routes("/ping/"))
+        self.assertFalse(middleware._has_child_routes("/completely/fake/path/"))
+
+    def test_async_capable(self):
+        from asgiref.sync import iscoroutinefunction
+
+        from apps.core.middleware import APIRootViewMiddleware
+
+        async def get_response(request):
+            return request
+
+        self.assertTrue(iscoroutinefunction(APIRootViewMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(APIRootViewMiddleware(lambda request: request)))
+
+    async def test_async_404_with_children_serves_index(self):
+        from django.test import AsyncClient
+
+        response = await AsyncClient().get("/api/v1/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("users", response.json())
+
 
 @pytest.mark.django_db
 class TestBrowsableAPIURLs:
@@ -0,0 +1,90 @@
+"""Tests for the keyset pagination of BaseViewSet viewsets."""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.core.models import Organization, Team
+from apps.core.pagination import KeysetPagination, estimate_count, is_indexed
+
+User = get_user_model()
+
+
+@override_settings(KEYSET_PAGINATION_ENABLED=True, KEYSET_PAGINATION_COUNT="exact")
+@mock.patch.object(KeysetPagination, "page_size", 2)
+class TestKeysetPagination(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(username="admin", password="password", email="admin@test.com")
+        cls.organizations = [Organization.objects.create(name=f"org-{i}") for i in range(5)]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def walk(self, url):
+        names = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            names += [result["name"] for result in response.data["results"]]
+            url = response.data["next"]
+        return names
+
+    def test_pages_follow_the_cursor(self):
+        response = self.client.get("/api/v1/organizations/")
+        self.assertEqual(list(response.data), ["count", "next", "previous", "results"])
+        self.assertEqual(response.data["count"], 5)
+        self.assertIn("cursor=", response.data["next"])
+        self.assertNotIn("offset", response.data["next"])
+        self.assertEqual(self.walk("/api/v1/organizations/"), [org.name for org in self.organizations])
+
+    def test_previous_page(self):
+        first = self.client.get("/api/v1/organizations/")
+        second = self.client.get(first.data["next"])
+        previous = self.client.get(second.data["previous"])
+        self.assertEqual(previous.data["results"], first.data["results"])
+
+    def test_ordering_on_indexed_field(self):
+        names = self.walk("/api/v1/organizations/?order_by=-name")
+        self.assertEqual(names, sorted((org.name for org in self.organizations), reverse=True))
+
+    def test_ordering_on_unindexed_field_falls_back_to_pk(self):
+        names = self.walk("/api/v1/organizations/?order_by=-description")
+        self.assertEqual(names, [org.name for org in self.organizations])
+
+    @override_settings(KEYSET_PAGINATION_COUNT="none")
+    def test_without_count(self):
+        response = self.client.get("/api/v1/organizations/")
+        self.assertNotIn("count", response.data)
+
+    @override_settings(KEYSET_PAGINATION_COUNT="estimated")
+    def test_estimated_count_is_exact_on_small_tables(self):
+        response = self.client.get("/api/v1/organizations/")
+        self.assertEqual(response.data["count"], 5)
+
+    @override_settings(KEYSET_PAGINATION_ENABLED=False)
+    def test_disabled(self):
+        response = self.client.get("/api/v1/organizations/")
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(response.data["count"], 5)
+
+
+class TestKeysetHelpers(TestCase):
+    def test_is_indexed(self):
+        self.assertTrue(is_indexed(Organization, "pk"))
+        self.assertTrue(is_indexed(Organization, "id"))
+        self.assertTrue(is_indexed(User, "username"))
+        self.assertFalse(is_indexed(Organization, "description"))
+        self.assertFalse(is_indexed(Team, "organization"))
+        self.assertFalse(is_indexed(Organization, "not_a_field"))
+
+    def test_estimate_count(self):
+        estimate = estimate_count(Organization.objects.filter(name__startswith="org-"))
+        if connection.vendor == "postgresql":
+            self.assertIsInstance(estimate, int)
+        else:
+            self.assertIsNone(estimate)
@@ -0,0 +1,47 @@
+"""Tests for the route introspection registry."""
+
+from django.test import RequestFactory, TestCase
+from django.urls import clear_url_caches
+from rest_framework.utils.breadcrumbs import get_breadcrumbs
+
+from apps.core.routes import RouteNode, get_route_registry
+
+
+class TestRouteRegistry(TestCase):
+    def test_registry_built_once_per_resolver(self):
+        registry = get_route_registry()
+        self.assertIs(get_route_registry(), registry)
+
+        clear_url_caches()
+        rebuilt = get_route_registry()
+        self.assertIsNot(rebuilt, registry)
+        self.assertEqual(rebuilt.children("/api/v1/"), registry.children("/api/v1/"))
+
+    def test_nodes_use_slots(self):
+        node = get_route_registry().root
+        self.assertIsInstance(node, RouteNode)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(TypeError):
+            node.children["new"] = node
+
+    def test_children_index(self):
+        children = get_route_registry().children("/api/v1/")
+        segments = [segment for segment, _ in children]
+        self.assertEqual(segments, sorted(segments))
+        self.assertIn("users", segments)
+        self.assertFalse(any("<" in segment or segment.startswith("_") for segment in segments))
+
+    def test_children_of_unknown_path(self):
+        self.assertEqual(get_route_registry().children("/completely/fake/path/"), ())
+
+    def test_could_resolve(self):
+        registry = get_route_registry()
+        self.assertTrue(registry.could_resolve("/ping/"))
+        self.assertTrue(registry.could_resolve("/api/v1/users/1/"))
+        self.assertFalse(registry.could_resolve("/completely/fake/path/"))
+
+    def test_breadcrumbs_match_drf(self):
+        request = RequestFactory().get("/api/v1/users/")
+        for path in ["/", "/api/", "/api/v1/", "/api/v1/users/", "/api/v1/users/1/"]:
+            with self.subTest(path=path):
+                self.assertEqual(get_route_registry().breadcrumbs(path, request), get_breadcrumbs(path, request))
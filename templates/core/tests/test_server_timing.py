@@ -0,0 +1,41 @@
+"""Tests for the Server-Timing middleware."""
+
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class TestServerTimingMiddleware(TestCase):
+    def test_disabled_by_default(self):
+        response = APIClient().get("/ping/")
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(SERVER_TIMING_ENABLED=True, SERVER_TIMING_SAMPLE_RATE=1.0)
+    def test_server_timing_header(self):
+        response = APIClient().get("/api/v1/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        phases = [entry.strip().split(";")[0] for entry in response["Server-Timing"].split(",")]
+        self.assertEqual(phases, ["total", "middleware", "view", "render", "db"])
+        self.assertIn('queries"', response["Server-Timing"])
+
+    @override_settings(SERVER_TIMING_ENABLED=True, SERVER_TIMING_SAMPLE_RATE=1.0)
+    def test_timing_log_line(self):
+        with self.assertLogs("apps.core.timing", level="INFO") as logs:
+            APIClient().get("/ping/")
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("method=GET route=ping status=200 total_ms=", logs.output[0])
+        self.assertIn("db_queries=", logs.output[0])
+
+    @override_settings(SERVER_TIMING_ENABLED=True, SERVER_TIMING_SAMPLE_RATE=0.0)
+    def test_unsampled_requests_not_instrumented(self):
+        response = APIClient().get("/ping/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(SERVER_TIMING_ENABLED=True, SERVER_TIMING_SAMPLE_RATE=1.0)
+    async def test_async_server_timing_header(self):
+        from django.test import AsyncClient
+
+        response = await AsyncClient().get("/ping/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("view;dur=", response["Server-Timing"])
@@ -0,0 +1,32 @@
+"""Helpers shared by the tests of the services."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def assert_constant_list_queries(client, url, create, sizes=(2, 10)):
+    """
+    Fail when the queries of a list endpoint grow with the number of objects listed.
+
+    Lists ``url`` once the first size of objects exists, then again after calling
+    ``create(index)`` up to each following size, sizes must fit in a page:
+
+        assert_constant_list_queries(client, "/api/v1/teams/", lambda i: Team.objects.create(...))
+    """
+    created = 0
+    counts = []
+    for size in sizes:
+        while created < size:
+            create(created)
+            created += 1
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert response.status_code == 200, response.data
+        counts.append((size, len(queries), [query["sql"] for query in queries.captured_queries]))
+
+    (first_size, first_count, first_sql), *others = counts
+    for size, count, sql in others:
+        assert count == first_count, (
+            f"Listing {url} ran {first_count} queries for {first_size} objects and {count} for {size}, "
+            f"an object or relation is loaded per row:\n" + "\n".join(sql[len(first_sql) :] or sql)
+        )
@@ -1,10 +1,13 @@
 from django.urls import include, path
 
 from .v1 import urls as v1_urls
-from .views import HealthView, PingView
+from .views import HealthView, LivenessView, MetricsView, PingView, ReadinessView
 
 urlpatterns = [
     path("ping/", PingView.as_view(), name="ping"),
     path("health/", HealthView.as_view(), name="health"),
+    path("livez/", LivenessView.as_view(), name="livez"),
+    path("readyz/", ReadinessView.as_view(), name="readyz"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path("api/v1/", include(v1_urls)),
 ]
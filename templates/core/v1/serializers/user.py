@@ -1,4 +1,5 @@
 from ansible_base.lib.serializers.common import CommonUserSerializer
+from django.contrib.auth.hashers import make_password
 from rest_framework import serializers
 
 from apps.core.models import User
@@ -15,17 +16,16 @@ class UserSerializer(CommonUserSerializer):
         }
 
     def create(self, validated_data):
-        password = validated_data.pop("password", None)
-        user = super().create(validated_data)
-        if password:
-            user.set_password(password)
-            user.save()
-        return user
+        self._hash_password(validated_data)
+        return super().create(validated_data)
 
     def update(self, instance, validated_data):
+        self._hash_password(validated_data)
+        return super().update(instance, validated_data)
+
+    @staticmethod
+    def _hash_password(validated_data):
+        # Hashed before saving so each user is written once, bulk endpoints save many
         password = validated_data.pop("password", None)
-        user = super().update(instance, validated_data)
         if password:
-            user.set_password(password)
-            user.save()
-        return user
+            validated_data["password"] = make_password(password)
@@ -1,6 +1,8 @@
 from .base import BaseViewSet
+from .bulk import BulkModelMixin
+from .export import ExportMixin
 from .organization import OrganizationViewSet
 from .team import TeamViewSet
 from .user import UserViewSet
 
-__all__ = ["BaseViewSet", "OrganizationViewSet", "TeamViewSet", "UserViewSet"]
+__all__ = ["BaseViewSet", "BulkModelMixin", "ExportMixin", "OrganizationViewSet", "TeamViewSet", "UserViewSet"]
@@ -1,16 +1,61 @@
 from ansible_base.lib.utils.views.ansible_base import AnsibleBaseView
 from ansible_base.rbac import permission_registry
 from ansible_base.rbac.api.permissions import AnsibleBaseObjectPermissions
+from django.conf import settings
+from rest_framework.generics import GenericAPIView
 from rest_framework.viewsets import ModelViewSet
 
+from apps.core import eager_loading, visibility
+from apps.core.pagination import KeysetPagination
 
-class BaseViewSet(ModelViewSet, AnsibleBaseView):
-    """Base viewset with RBAC filtering."""
+from .bulk import BulkModelMixin
+from .export import ExportMixin
+
+
+class BaseViewSet(BulkModelMixin, ExportMixin, ModelViewSet, AnsibleBaseView):
+    """
+    Base viewset with RBAC filtering, bulk endpoints (BulkModelMixin) and streaming
+    exports (ExportMixin).
+
+    The queryset eagerly loads the relations read by the serializer, see
+    apps/core/eager_loading.py. `select_related` and `prefetch_related` add the lookups
+    read by serializer method fields, `eager_loading = False` disables it.
+    """
 
     permission_classes = [AnsibleBaseObjectPermissions]
+    eager_loading = True
+    select_related = ()
+    prefetch_related = ()
+
+    # Plans by serializer class, planning walks every field of the serializer
+    _query_plans = {}
+
+    @property
+    def paginator(self):
+        # Keyset pagination replaces the default pagination, not the one set by a viewset
+        if (
+            not hasattr(self, "_paginator")
+            and self.pagination_class is GenericAPIView.pagination_class
+            and settings.KEYSET_PAGINATION_ENABLED
+        ):
+            self._paginator = KeysetPagination()
+        return super().paginator
+
+    def get_query_plan(self):
+        serializer_class = self.get_serializer_class()
+        query_plan = self._query_plans.get(serializer_class)
+        if query_plan is None:
+            query_plan = self._query_plans[serializer_class] = eager_loading.plan(self.get_serializer())
+        return query_plan.extend(self.select_related, self.prefetch_related)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.eager_loading:
+            queryset = self.get_query_plan().apply(queryset)
+        return queryset
 
     def filter_queryset(self, queryset):
         cls = queryset.model
         if permission_registry.is_registered(cls):
-            queryset = cls.access_qs(self.request.user, queryset=queryset)
+            queryset = visibility.filter_visible(self.request.user, queryset, cls.access_qs)
         return super().filter_queryset(queryset)
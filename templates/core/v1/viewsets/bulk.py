@@ -0,0 +1,227 @@
+import copy
+import json
+
+from ansible_base.rbac import permission_registry
+from ansible_base.rbac.api.permissions import AnsibleBaseObjectPermissions
+from ansible_base.rbac.api.related import check_related_permissions, related_permission_fields
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotAuthenticated, PermissionDenied, ValidationError
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.response import Response
+
+NOT_FOUND = "Not found."
+PERMISSION_DENIED = "You do not have permission to perform this action."
+
+
+class BulkModelMixin:
+    """
+    Bulk create, update and delete at `<resource>/bulk/`.
+
+    - `POST` a list of objects to create them
+    - `PATCH` a list of partial objects, each with its `id`, to update them
+    - `DELETE` a list of ids to delete the objects
+
+    A batch is applied in a single transaction and only when every item succeeds,
+    errors are reported per item in `errors`, a list aligned with the payload, with a
+    403 status when an item is denied and 400 otherwise. Batches are limited to
+    `BULK_MAX_ITEMS` items.
+
+    Items are saved one by one through the serializer and the `perform_*` hooks so
+    the RBAC evaluations and the resource registry, which hook `post_save`, stay in
+    sync. Permissions are checked per batch: once per distinct value of the
+    `bulk_permission_fields` of the created items (the related fields of the
+    serializer by default, None to check every item), including the permission to
+    use their related objects (e.g. `add_team` on the organization), and with a single
+    query for the objects updated or deleted.
+    """
+
+    bulk_permission_fields = ()
+
+    @action(detail=False, methods=["post"], url_path="bulk", url_name="bulk")
+    def bulk_create(self, request):
+        items = self._bulk_items(request)
+        errors = [{} for _ in items]
+        self._check_create_permissions(request, items, errors)
+        item_serializers = self._validate(items, [None] * len(items), errors)
+        return self._save(item_serializers, errors, self.perform_create, status.HTTP_201_CREATED)
+
+    @bulk_create.mapping.patch
+    def bulk_update(self, request):
+        items = self._bulk_items(request)
+        errors = [{} for _ in items]
+        objects = self._get_objects([item.get("id") if isinstance(item, dict) else None for item in items])
+        for index, obj in enumerate(objects):
+            if obj is None and not errors[index]:
+                errors[index] = {"id": [NOT_FOUND]}
+        self._check_object_permissions(request, objects, errors)
+        item_serializers = self._validate(items, objects, errors, partial=True)
+        return self._save(item_serializers, errors, self.perform_update, status.HTTP_200_OK)
+
+    @bulk_create.mapping.delete
+    def bulk_destroy(self, request):
+        ids = self._bulk_items(request)
+        errors = [{} for _ in ids]
+        objects = self._get_objects(ids)
+        for index, obj in enumerate(objects):
+            if obj is None:
+                errors[index] = {"id": [NOT_FOUND]}
+        self._check_object_permissions(request, objects, errors)
+        if any(errors):
+            return self._error_response(errors)
+        with transaction.atomic():
+            for obj in objects:
+                self.perform_destroy(obj)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def _bulk_items(self, request):
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"detail": "Expected a non empty list."})
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise ValidationError({"detail": f"A batch can't have more than {settings.BULK_MAX_ITEMS} items."})
+        return items
+
+    def _get_objects(self, ids):
+        """Return the visible object of every id, None for the ids not found or repeated."""
+        queryset = self.filter_queryset(self.get_queryset())
+        pks = []
+        for pk in ids:
+            try:
+                pks.append(queryset.model._meta.pk.to_python(pk))
+            except DjangoValidationError:
+                pks.append(None)
+        found = queryset.in_bulk({pk for pk in pks if pk is not None})
+        objects = []
+        for pk in pks:
+            objects.append(found.pop(pk, None) if pk is not None else None)
+        return objects
+
+    def _has_permission(self, request):
+        try:
+            self.check_permissions(request)
+        except (NotAuthenticated, PermissionDenied):
+            return False
+        return True
+
+    def _has_related_permissions(self, request, item):
+        """Return whether the user may use the related objects of an item, as DAB checks on save."""
+        model = self.get_queryset().model
+        data = {}
+        for field in related_permission_fields(model):
+            if item.get(field.name) is None:
+                if not field.null:
+                    # Left to the validation of the item
+                    return True
+                continue
+            try:
+                data[field.name] = field.target_field.to_python(item[field.name])
+            except DjangoValidationError:
+                return True
+        try:
+            check_related_permissions(request.user, model, {}, data)
+        except PermissionDenied:
+            return False
+        return True
+
+    def _check_create_permissions(self, request, items, errors):
+        """Check the create permissions of the view once per permission key of the items."""
+        fields = self.bulk_permission_fields
+        if fields == ():
+            fields = [
+                name
+                for name, field in self.get_serializer().fields.items()
+                if isinstance(field, (RelatedField, ManyRelatedField)) and not field.read_only
+            ]
+        bulk_action = self.action
+        # Permission classes decide on the create action and a single item as data
+        self.action = "create"
+        allowed = {}
+        try:
+            for index, item in enumerate(items):
+                key = index
+                if fields is not None and isinstance(item, dict):
+                    key = json.dumps([item.get(name) for name in fields], default=str)
+                if key not in allowed:
+                    item_request = copy.copy(request)
+                    item_request._full_data = item
+                    allowed[key] = self._has_permission(item_request) and (
+                        not isinstance(item, dict) or self._has_related_permissions(request, item)
+                    )
+                if not allowed[key]:
+                    errors[index] = {"detail": [PERMISSION_DENIED]}
+        finally:
+            self.action = bulk_action
+
+    def _check_object_permissions(self, request, objects, errors):
+        found = [obj for obj in objects if obj is not None]
+        if not found:
+            return
+        model = type(found[0])
+        permissions = self.get_permissions()
+        if permission_registry.is_registered(model) and all(
+            type(permission) is AnsibleBaseObjectPermissions for permission in permissions
+        ):
+            codename = "delete" if request.method == "DELETE" else "change"
+            queryset = model._default_manager.filter(pk__in=[obj.pk for obj in found])
+            allowed = set(model.access_qs(request.user, codename, queryset=queryset).values_list("pk", flat=True))
+        else:
+            allowed = set()
+            for obj in found:
+                try:
+                    self.check_object_permissions(request, obj)
+                except (NotAuthenticated, PermissionDenied):
+                    continue
+                allowed.add(obj.pk)
+        for index, obj in enumerate(objects):
+            if obj is not None and obj.pk not in allowed:
+                errors[index] = {"detail": [PERMISSION_DENIED]}
+
+    def _validate(self, items, objects, errors, partial=False):
+        item_serializers = []
+        for index, (item, obj) in enumerate(zip(items, objects)):
+            if errors[index]:
+                item_serializers.append(None)
+                continue
+            if not isinstance(item, dict):
+                errors[index] = {"non_field_errors": ["Expected an object."]}
+                item_serializers.append(None)
+                continue
+            serializer = self.get_serializer(obj, data=item, partial=partial)
+            try:
+                if not serializer.is_valid():
+                    errors[index] = serializer.errors
+            except PermissionDenied:
+                errors[index] = {"detail": [PERMISSION_DENIED]}
+            item_serializers.append(serializer)
+        return item_serializers
+
+    def _save(self, item_serializers, errors, perform, status_code):
+        if any(errors):
+            return self._error_response(errors)
+        with transaction.atomic():
+            for index, serializer in enumerate(item_serializers):
+                try:
+                    # A savepoint per item, so a constraint violation reports the item
+                    with transaction.atomic():
+                        perform(serializer)
+                except PermissionDenied:
+                    errors[index] = {"detail": [PERMISSION_DENIED]}
+                except (IntegrityError, serializers.ValidationError) as e:
+                    detail = e.detail if isinstance(e, serializers.ValidationError) else [str(e)]
+                    errors[index] = detail if isinstance(detail, dict) else {"non_field_errors": detail}
+            if any(errors):
+                transaction.set_rollback(True)
+                return self._error_response(errors)
+        return Response([serializer.data for serializer in item_serializers], status=status_code)
+
+    @staticmethod
+    def _error_response(errors):
+        denied = any(error.get("detail") == [PERMISSION_DENIED] for error in errors)
+        return Response(
+            {"errors": errors},
+            status=status.HTTP_403_FORBIDDEN if denied else status.HTTP_400_BAD_REQUEST,
+        )
@@ -3,6 +3,7 @@ from ansible_base.rbac.policies import visible_users
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from apps.core import visibility
 from apps.core.models import User
 from apps.core.v1.serializers import UserSerializer
 
@@ -13,9 +14,11 @@ class UserViewSet(BaseViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [AnsibleBaseUserPermissions]
+    # User permission policies depend on the whole payload, check every created user
+    bulk_permission_fields = None
 
     def filter_queryset(self, queryset):
-        queryset = visible_users(self.request.user, queryset=queryset)
+        queryset = visibility.filter_visible(self.request.user, queryset, visible_users)
         return super(BaseViewSet, self).filter_queryset(queryset)
 
     @action(detail=False, methods=["get"])
@@ -1,5 +1,6 @@
 from .api_root import APIRootView
-from .health import HealthView
+from .health import HealthView, LivenessView, ReadinessView
+from .metrics import MetricsView
 from .ping import PingView
 
-__all__ = ["PingView", "HealthView", "APIRootView"]
+__all__ = ["PingView", "HealthView", "LivenessView", "ReadinessView", "MetricsView", "APIRootView"]
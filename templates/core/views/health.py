@@ -1,33 +1,47 @@
 from ansible_base.lib.utils.views.ansible_base import AnsibleBaseView
-from django.db import connection
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from apps.core import health
 
-class HealthView(AnsibleBaseView):
-    """
-    Health check endpoint to verify service health.
 
-    Checks database connectivity and returns overall health status.
-    """
+class _ProbeView(AnsibleBaseView):
+    """Serve the report of a health probe, see `apps.core.health`."""
 
     permission_classes = [AllowAny]
     authentication_classes = []
+    probe = health.READINESS
 
     def get(self, request):
-        health_status: dict = {"status": "healthy", "checks": {}}
+        report = health.run_checks(self.probe)
+        http_status = status.HTTP_200_OK if report.healthy else status.HTTP_503_SERVICE_UNAVAILABLE
+        return Response(report.to_dict(), status=http_status, headers={"Cache-Control": "no-store"})
+
+
+class HealthView(_ProbeView):
+    """
+    Health check endpoint to verify service health.
+
+    Runs the readiness checks (database, cache, migrations...) and returns
+    overall health status.
+    """
 
-        # Database check
-        try:
-            connection.ensure_connection()
-            health_status["checks"]["database"] = "ok"
-        except Exception as e:
-            health_status["status"] = "unhealthy"
-            health_status["checks"]["database"] = f"error: {str(e)}"
 
-        http_status = (
-            status.HTTP_200_OK if health_status["status"] == "healthy" else status.HTTP_503_SERVICE_UNAVAILABLE
-        )
+class LivenessView(_ProbeView):
+    """
+    Liveness probe, the process is able to serve requests.
+
+    Only runs the checks registered for liveness, none by default, so it never
+    restarts the service because of a dependency outage.
+    """
+
+    probe = health.LIVENESS
+
+
+class ReadinessView(_ProbeView):
+    """
+    Readiness probe, the dependencies needed to serve traffic are available.
+    """
 
-        return Response(health_status, status=http_status)
+    probe = health.READINESS
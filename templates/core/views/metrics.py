@@ -0,0 +1,17 @@
+from django.http import HttpResponse
+from django.views import View
+
+from apps.core import metrics
+
+
+class MetricsView(View):
+    """
+    Prometheus metrics endpoint.
+
+    A plain Django view: the exposition format is not negotiated and the scrape
+    must not go through DRF authentication and renderers.
+    """
+
+    def get(self, request):
+        body, content_type = metrics.render()
+        return HttpResponse(body, content_type=content_type)
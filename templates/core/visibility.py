@@ -0,0 +1,183 @@
+"""
+Cached RBAC visibility of the list endpoints.
+
+`access_qs()` and `visible_users()` filter every list on a subquery of the role
+evaluations of the user, which dominates the latency of users holding thousands of
+role assignments. With `RBAC_VISIBILITY_CACHE_ENABLED = True`, `filter_visible()`
+evaluates that subquery once, caches the primary keys it returns and filters the
+following requests on them.
+
+Cached keys are versioned, instead of deleting keys the signal receivers below
+replace a version and every entry computed under the previous one is ignored:
+
+- a per user version, replaced when a role is given to or removed from the user
+- a membership version, replaced on the same changes and when users are created or
+  their superuser flags change, that only the user lists depend on as users see
+  the members of their organizations and teams
+- a global version, replaced when a team role or a role definition changes, when an
+  object tracked by RBAC is created below a parent or moved to another one, and when
+  a team is deleted, as those change the role evaluations of other objects
+
+Changes that send no signals (`bulk_create`, `QuerySet.update`) are only seen once
+the entries expire after `RBAC_VISIBILITY_CACHE_TTL` seconds. Superusers, who see
+everything, and users seeing more than `RBAC_VISIBILITY_CACHE_MAX_IDS` objects are
+not cached: the cached keys are sent to the database as a list, which costs more
+than the indexed subquery once it holds a few hundred keys.
+
+The versions must be shared by the processes serving the API: use a cache shared by
+the workers (Redis, Memcached, database) as `RBAC_VISIBILITY_CACHE_ALIAS`.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+
+_GLOBAL_VERSION_KEY = "rbac-visibility:version"
+_MEMBERSHIP_VERSION_KEY = "rbac-visibility:membership:version"
+# Parent id of a registered object as loaded or before saving, stashed by DAB RBAC
+_ORIGINAL_PARENT_ATTR = "__rbac_original_parent_id"
+_UNKNOWN = object()
+
+
+def _cache():
+    return caches[settings.RBAC_VISIBILITY_CACHE_ALIAS]
+
+
+def _user_version_key(user_id):
+    return f"rbac-visibility:user:{user_id}:version"
+
+
+def _versions(cache, keys):
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Another process may set it first, keep the version it set
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            versions[key] = cache.get(key)
+    return ":".join(versions[key] for key in keys)
+
+
+def _visible_ids(user, model, visible):
+    cache = _cache()
+    keys = [_GLOBAL_VERSION_KEY, _user_version_key(user.pk)]
+    if model is get_user_model():
+        # Users see the members of their organizations and teams
+        keys.append(_MEMBERSHIP_VERSION_KEY)
+    key = f"rbac-visibility:{model._meta.label_lower}:{user.pk}:{_versions(cache, keys)}"
+    ids = cache.get(key)
+    if ids is None:
+        limit = settings.RBAC_VISIBILITY_CACHE_MAX_IDS
+        ids = list(visible(user, queryset=model._default_manager.all()).values_list("pk", flat=True)[: limit + 1])
+        if len(ids) > limit:
+            # Cached as such, the next requests don't evaluate the subquery twice
+            ids = False
+        cache.set(key, ids, timeout=settings.RBAC_VISIBILITY_CACHE_TTL)
+    return ids
+
+
+def filter_visible(user, queryset, visible):
+    """
+    Return ``queryset`` restricted to the objects ``user`` can see.
+
+    Args:
+        user: The user listing the objects
+        queryset: Queryset of the objects
+        visible: ``visible(user, queryset=queryset)`` returning the visible objects,
+            e.g. `Model.access_qs` or `visible_users`
+    """
+    if not settings.RBAC_VISIBILITY_CACHE_ENABLED or not getattr(user, "pk", None) or user.is_superuser:
+        return visible(user, queryset=queryset)
+    ids = _visible_ids(user, queryset.model, visible)
+    if ids is False:
+        return visible(user, queryset=queryset)
+    return queryset.filter(pk__in=ids)
+
+
+def invalidate(user_id=None):
+    """Forget the cached visibility of a user, or of every user."""
+    cache = _cache()
+    if user_id is None:
+        cache.set(_GLOBAL_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        return
+    # The roles of a user change what they see, and who sees them in the user lists
+    versions = {_user_version_key(user_id): uuid.uuid4().hex, _MEMBERSHIP_VERSION_KEY: uuid.uuid4().hex}
+    cache.set_many(versions, timeout=None)
+
+
+# Signal receivers, connected by CoreConfig.ready()
+
+
+def _user_assignment_changed(sender, instance, **kwargs):
+    if settings.RBAC_VISIBILITY_CACHE_ENABLED:
+        invalidate(instance.user_id)
+
+
+def _roles_changed(sender, **kwargs):
+    if settings.RBAC_VISIBILITY_CACHE_ENABLED:
+        invalidate()
+
+
+def _parent_changing(sender, instance, update_fields=None, **kwargs):
+    from ansible_base.rbac import permission_registry
+
+    parent = permission_registry.get_parent_fd_name(sender)
+    if not settings.RBAC_VISIBILITY_CACHE_ENABLED or parent is None or instance._state.adding:
+        return
+    if update_fields is not None and not {parent, f"{parent}_id"} & set(update_fields):
+        return
+    # Objects loaded without their parent column are assumed to move
+    original = getattr(instance, _ORIGINAL_PARENT_ATTR, _UNKNOWN)
+    instance._visibility_parent_changed = original != getattr(instance, f"{parent}_id")
+
+
+def _object_saved(sender, instance, created=False, **kwargs):
+    from ansible_base.rbac import permission_registry
+
+    if not settings.RBAC_VISIBILITY_CACHE_ENABLED:
+        return
+    parent = permission_registry.get_parent_fd_name(sender)
+    if created:
+        # Roles on the parent now give access to the object
+        moved = parent is not None and getattr(instance, f"{parent}_id") is not None
+    else:
+        moved = instance.__dict__.pop("_visibility_parent_changed", False)
+    if moved:
+        invalidate()
+
+
+def _user_saved(sender, instance, created=False, update_fields=None, **kwargs):
+    if not settings.RBAC_VISIBILITY_CACHE_ENABLED:
+        return
+    # Superusers are listed to every user, new users to those allowed to see all users
+    flags = set(settings.ANSIBLE_BASE_BYPASS_SUPERUSER_FLAGS)
+    if created or update_fields is None or flags & set(update_fields):
+        _cache().set(_MEMBERSHIP_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def _team_deleted(sender, **kwargs):
+    if settings.RBAC_VISIBILITY_CACHE_ENABLED:
+        # Roles given to the team are gone from the evaluations of its members
+        invalidate()
+
+
+def connect_signals():
+    from ansible_base.rbac import permission_registry
+    from ansible_base.rbac.models import ObjectRole, RoleDefinition, RoleTeamAssignment, RoleUserAssignment
+
+    for signal in (post_save, post_delete):
+        signal.connect(_user_assignment_changed, sender=RoleUserAssignment, dispatch_uid="core.visibility.user")
+        for sender in (RoleTeamAssignment, ObjectRole, RoleDefinition):
+            signal.connect(_roles_changed, sender=sender, dispatch_uid=f"core.visibility.{sender.__name__}")
+    # Objects tracked by RBAC only, the other models don't change what users see
+    for model in permission_registry.all_registered_models:
+        uid = f"core.visibility.object.{model._meta.label_lower}"
+        pre_save.connect(_parent_changing, sender=model, dispatch_uid=uid)
+        post_save.connect(_object_saved, sender=model, dispatch_uid=uid)
+    post_save.connect(_user_saved, sender=permission_registry.user_model, dispatch_uid="core.visibility.users")
+    post_delete.connect(_team_deleted, sender=permission_registry.team_model, dispatch_uid="core.visibility.teams")
+    # Roles given or removed in bulk through the m2m fields of ObjectRole and RoleDefinition
+    for sender in (RoleUserAssignment, RoleTeamAssignment, RoleDefinition.permissions.through):
+        m2m_changed.connect(_roles_changed, sender=sender, dispatch_uid=f"core.visibility.m2m.{sender.__name__}")
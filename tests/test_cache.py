@@ -0,0 +1,113 @@
+"""Tests for the persistent template cache."""
+
+import os
+
+import pytest
+from git import Repo
+
+from platform_service_framework import cache
+from platform_service_framework.cli import app
+from platform_service_framework.utils import template_snapshot
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    """Point the template cache to a temporary directory."""
+    root = tmp_path / "cache"
+    monkeypatch.setenv("FRAMEWORK_CACHE_DIR", str(root))
+    return root
+
+
+@pytest.fixture
+def remote_url(tmp_path, monkeypatch):
+    """A git repository reachable through a file:// URL, like a remote."""
+    # Annotated tags need a tagger identity
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+    path = tmp_path / "template"
+    path.mkdir()
+    repo = Repo.init(str(path), initial_branch="main")
+    (path / "copier.yml").write_text("project_name:\n  type: str\n")
+    repo.index.add(["copier.yml"])
+    repo.index.commit("Initial commit")
+    repo.create_tag("v1.0.0", message="Release 1.0.0")
+    repo.create_head("devel")
+    return f"file://{path}"
+
+
+def test_resolve_fetches_once(cache_root, remote_url):
+    """A second resolve of the same ref is served from the cache."""
+    entry = cache.resolve(remote_url, "main")
+    assert (entry.path / "copier.yml").exists()
+    assert {head.name for head in Repo(entry.path).heads} == {"main", "devel"}
+
+    again = cache.resolve(remote_url, "main")
+    assert again.path == entry.path
+    assert len(cache.list_entries()) == 1
+
+
+def test_resolve_is_keyed_by_commit(cache_root, remote_url):
+    """Refs pointing to the same commit share the cache entry."""
+    branch_entry = cache.resolve(remote_url, "devel")
+    tag_entry = cache.resolve(remote_url, "v1.0.0")
+    assert tag_entry.commit == branch_entry.commit
+    assert tag_entry.path == branch_entry.path
+
+
+def test_resolve_offline(cache_root, remote_url):
+    """Offline mode only resolves refs that are already cached."""
+    with pytest.raises(RuntimeError, match="not cached"):
+        cache.resolve(remote_url, "main", offline=True)
+
+    entry = cache.resolve(remote_url, "main")
+    assert cache.resolve(remote_url, "main", offline=True).path == entry.path
+    assert cache.resolve(remote_url, entry.commit[:10], offline=True).path == entry.path
+
+
+def test_prune_evicts_least_recently_used(cache_root, remote_url):
+    """Entries are evicted oldest first until the cache fits the bound."""
+    first = cache.resolve(remote_url, "main")
+    repo = Repo(remote_url.removeprefix("file://"))
+    repo.index.commit("Second commit")
+    second = cache.resolve(remote_url, "main")
+    assert first.path != second.path
+
+    os.utime(first.metadata_file, (0, 0))
+    evicted = cache.prune(second.size)
+
+    assert [entry.path for entry in evicted] == [first.path]
+    assert not first.path.exists()
+    assert second.path.exists()
+
+
+def test_template_snapshot_redirects_git(cache_root, remote_url, tmp_path):
+    """Git calls made by copier for the remote URL are served by the cache."""
+    from plumbum import local
+
+    with template_snapshot(remote_url, "main") as snapshot_path:
+        assert snapshot_path == str(cache.resolve(remote_url, "main").path)
+        config = {
+            local.env[f"GIT_CONFIG_KEY_{i}"]: local.env[f"GIT_CONFIG_VALUE_{i}"]
+            for i in range(int(local.env["GIT_CONFIG_COUNT"]))
+        }
+        assert config[f"url.{snapshot_path}.insteadOf"] == remote_url
+
+    assert "GIT_CONFIG_COUNT" not in local.env
+
+
+def test_cache_commands(cache_root, remote_url, capsys):
+    """The cache list and prune commands report and remove entries."""
+    entry = cache.resolve(remote_url, "main")
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["cache", "list"])
+    assert exc_info.value.code == 0
+    out = capsys.readouterr().out
+    assert entry.commit[:12] in out
+    assert "Total: 1 entries" in out
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["cache", "prune", "--all"])
+    assert exc_info.value.code == 0
+    assert "Pruned 1 entries" in capsys.readouterr().out
+    assert cache.list_entries() == []
@@ -1,8 +1,19 @@
 """Tests for the completions command."""
 
+import subprocess
+import sys
+
 import pytest
 
 from platform_service_framework.cli import app
+from platform_service_framework.completions import completion_file
+
+
+@pytest.fixture(autouse=True)
+def cache_root(tmp_path, monkeypatch):
+    """Keep cached completion scripts out of the user's cache."""
+    monkeypatch.setenv("FRAMEWORK_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
 
 
 def test_completions_generates_output(capsys):
@@ -48,3 +59,60 @@ def test_completions_no_errors(capsys):
     captured = capsys.readouterr()
     # Verify no error output
     assert captured.err == ""
+
+
+def test_completions_are_cached(capsys):
+    """Test the script is generated once per shell and served from the cache."""
+    with pytest.raises(SystemExit) as exc_info:
+        app(["completions", "--shell", "bash"])
+    assert exc_info.value.code == 0
+
+    script = capsys.readouterr().out
+    assert script.startswith("# Bash completion for platform-service-framework")
+    assert completion_file("bash").read_text() + "\n" == script
+
+    completion_file("bash").write_text("# cached")
+    with pytest.raises(SystemExit):
+        app(["completions", "--shell", "bash"])
+    assert capsys.readouterr().out == "# cached\n"
+
+    with pytest.raises(SystemExit):
+        app(["completions", "--shell", "bash", "--refresh"])
+    assert capsys.readouterr().out == script
+
+
+def test_completions_output_file(tmp_path, capsys):
+    """Test the script can be written to a static completion file."""
+    output = tmp_path / "completions" / "platform-service-framework.fish"
+    with pytest.raises(SystemExit) as exc_info:
+        app(["completions", "--shell", "fish", "--output", str(output)])
+
+    assert exc_info.value.code == 0
+    assert output.read_text() == completion_file("fish").read_text()
+    assert f"Completion script written to {output}" in capsys.readouterr().out
+
+
+def test_entry_point_serves_cached_script(cache_root):
+    """Test the entry point prints a cached script without importing the CLI."""
+    completion_file("zsh").parent.mkdir(parents=True)
+    completion_file("zsh").write_text("#compdef platform-service-framework")
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from platform_service_framework import main\n"
+            "main()\n"
+            "print('cyclopts' in sys.modules, file=sys.stderr)",
+            "completions",
+            "--shell",
+            "zsh",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout == "#compdef platform-service-framework\n"
+    assert result.stderr.strip() == "False"
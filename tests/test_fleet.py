@@ -0,0 +1,78 @@
+"""Tests for the fleet command."""
+
+import json
+
+import pytest
+
+from platform_service_framework.cli import app
+
+
+@pytest.fixture
+def services(isolated_dir):
+    """Two initialized service repositories."""
+    paths = [isolated_dir / "alpha-service", isolated_dir / "beta-service"]
+    for path in paths:
+        with pytest.raises(SystemExit) as exc_info:
+            app(["init", str(path), "--apps"])
+        assert exc_info.value.code == 0
+    return paths
+
+
+def test_fleet_requires_repositories(isolated_dir, capsys):
+    """Test fleet fails when no repositories are given."""
+    with pytest.raises(SystemExit) as exc_info:
+        app(["fleet"])
+
+    assert exc_info.value.code == 1
+    assert "No repositories to update" in capsys.readouterr().out
+
+
+def test_fleet_updates_glob(services, isolated_dir, capsys):
+    """Test fleet expands globs and reports every repository."""
+    capsys.readouterr()
+    report = isolated_dir / "report.json"
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["fleet", str(isolated_dir / "*-service"), "--report", str(report)])
+
+    assert exc_info.value.code == 0
+    out = capsys.readouterr().out
+    assert "Updating 2 repositories" in out
+    assert "2 no-op" in out
+
+    data = json.loads(report.read_text())
+    assert [repo["path"] for repo in data["repositories"]] == [str(path) for path in services]
+    assert {repo["status"] for repo in data["repositories"]} == {"no-op"}
+    assert data["summary"]["no-op"] == 2
+
+
+def test_fleet_reports_failures(services, isolated_dir, capsys):
+    """Test fleet keeps going when repositories fail and exits with an error."""
+    (services[0] / "dirty.txt").write_text("uncommitted")
+    not_a_project = isolated_dir / "not-a-project"
+    not_a_project.mkdir()
+    manifest = isolated_dir / "services.txt"
+    manifest.write_text(
+        "# services managed by the platform team\n"
+        "alpha-service\n"
+        "beta-service\n"
+        "not-a-project\n"
+    )
+    report = isolated_dir / "report.json"
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["fleet", "--manifest", str(manifest), "--report", str(report), "--jobs", "2"])
+
+    assert exc_info.value.code == 1
+    out = capsys.readouterr().out
+    assert "Working tree has uncommitted changes" in out
+
+    statuses = {
+        repo["path"]: repo["status"] for repo in json.loads(report.read_text())["repositories"]
+    }
+    assert statuses == {
+        str(services[0]): "error",
+        str(services[1]): "no-op",
+        str(not_a_project): "validation failed",
+    }
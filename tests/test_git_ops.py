@@ -0,0 +1,64 @@
+"""Tests for the git operations layer."""
+
+import pytest
+from git import Repo
+
+from platform_service_framework.git_ops import Workspace
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Workspace with a single committed file."""
+    repo = Repo.init(tmp_path)
+    (tmp_path / "tracked.txt").write_text("one")
+    repo.index.add(["tracked.txt"])
+    repo.index.commit("Initial commit")
+    return Workspace(tmp_path)
+
+
+def test_status_clean(workspace):
+    """Test a committed tree is clean."""
+    assert workspace.status().clean
+
+
+def test_status_changed_paths(workspace):
+    """Test modified and untracked paths are reported, restricted to the pathspec."""
+    (workspace.path / "tracked.txt").write_text("two")
+    (workspace.path / "new.txt").write_text("new")
+    (workspace.path / "other.txt").write_text("other")
+
+    assert sorted(workspace.status().changed) == ["new.txt", "other.txt", "tracked.txt"]
+    assert workspace.status(["tracked.txt", "new.txt"]).changed == ["tracked.txt", "new.txt"]
+    assert workspace.status().conflicts == []
+
+
+def test_stage_only_given_paths(workspace):
+    """Test staging leaves other changes out of the commit."""
+    (workspace.path / "tracked.txt").unlink()
+    (workspace.path / "new.txt").write_text("new")
+    (workspace.path / "other.txt").write_text("other")
+
+    workspace.stage(["tracked.txt", "new.txt"])
+    workspace.commit("Stage some paths")
+
+    assert set(workspace.repo.head.commit.stats.files) == {"tracked.txt", "new.txt"}
+    assert workspace.status().changed == ["other.txt"]
+
+
+def test_squash(workspace):
+    """Test commits made on top of a base are squashed into one."""
+    base = workspace.head
+    assert workspace.squash(base, "Nothing to squash") is None
+
+    for index in range(2):
+        (workspace.path / f"file{index}.txt").write_text(str(index))
+        workspace.stage([f"file{index}.txt"])
+        workspace.commit(f"Add file {index}")
+
+    commit = workspace.squash(base, "Add files")
+
+    head = workspace.repo.head.commit
+    assert head.hexsha == commit
+    assert head.parents[0].hexsha == base
+    assert head.message == "Add files\n\nSquashed changes:\n- Add file 0\n- Add file 1\n"
+    assert set(head.stats.files) == {"file0.txt", "file1.txt"}
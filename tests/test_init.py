@@ -1,8 +1,10 @@
 """Tests for the init command."""
+import os
 import subprocess
 from pathlib import Path
 
 import pytest
+import yaml
 from git import Repo
 
 from platform_service_framework.cli import app
@@ -242,3 +244,89 @@ def test_init_run_all_project_checks(isolated_env, capsys):
         f"stderr: {test_exec.stderr}"
     )
 
+
+def test_init_with_single_job(isolated_env, capsys):
+    """Test init renders apps serially when --jobs is 1."""
+    tmp_path, _ = isolated_env
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init", "--apps", "api", "web", "--jobs", "1"])
+
+    assert exc_info.value.code == 0
+    assert (tmp_path / "apps" / "core" / ".copier-answers.yml").exists()
+    assert (tmp_path / "apps" / "api" / ".copier-answers.yml").exists()
+    assert (tmp_path / "apps" / "web" / ".copier-answers.yml").exists()
+
+
+def test_init_parallel_output_is_ordered(isolated_env, capsys):
+    """Test parallel init reports apps in the order they were requested."""
+    tmp_path, _ = isolated_env
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init", "--apps", "web", "api", "billing", "--jobs", "4"])
+
+    assert exc_info.value.code == 0
+    for app_name in ("core", "web", "api", "billing"):
+        assert (tmp_path / "apps" / app_name / ".copier-answers.yml").exists()
+
+    out = capsys.readouterr().out
+    positions = [
+        out.index("Created core app"),
+        out.index("Created app web"),
+        out.index("Created app api"),
+        out.index("Created app billing"),
+    ]
+    assert positions == sorted(positions)
+
+
+def test_init_dev_deploy_probes_pass(isolated_env):
+    """Test the probes of the dev deployment pass with the development settings."""
+    tmp_path, _ = isolated_env
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init"])
+
+    assert exc_info.value.code == 0
+
+    # Probe paths as rendered in the dev deployment manifest
+    deployment = next(yaml.safe_load_all((tmp_path / "app-dev-deploy.yml").read_text()))
+    container = deployment["spec"]["template"]["spec"]["containers"][0]
+    paths = [container[probe]["httpGet"]["path"] for probe in ("readinessProbe", "livenessProbe")]
+
+    # Same steps as the container: migrate, then serve with the development settings
+    debug = next(var["name"] for var in container["env"] if var["name"].endswith("_DEBUG"))
+    prefix = debug[: -len("DEBUG")]
+    env = {
+        **os.environ,
+        f"{prefix}MODE": "development",
+        f"{prefix}DATABASES__default__NAME": str(tmp_path / "dev.sqlite3"),
+    }
+    for command in (["makemigrations"], ["migrate"]):
+        exec_ = subprocess.run(
+            ["uv", "run", "manage.py", *command],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        assert exec_.returncode == 0, f"manage.py {command[0]} failed\nstderr: {exec_.stderr}"
+
+    script = (
+        "from django.test import Client\n"
+        f"for path in {paths!r}:\n"
+        "    print(path, Client().get(path, HTTP_HOST='localhost').status_code)\n"
+    )
+    probe_exec = subprocess.run(
+        ["uv", "run", "manage.py", "shell", "-c", script],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert probe_exec.returncode == 0, f"stderr: {probe_exec.stderr}"
+    for path in paths:
+        assert f"{path} 200" in probe_exec.stdout, (
+            f"probe {path} failed in development mode\n"
+            f"stdout: {probe_exec.stdout}\n"
+            f"stderr: {probe_exec.stderr}"
+        )
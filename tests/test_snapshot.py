@@ -0,0 +1,33 @@
+"""Tests for the shared template snapshot."""
+
+import yaml
+
+from platform_service_framework.utils import restore_src_path, template_snapshot
+
+
+def test_template_snapshot_local_source_is_unchanged(local_repo_url):
+    """Local sources are already on disk and are used directly."""
+    with template_snapshot(local_repo_url) as snapshot_path:
+        assert snapshot_path == local_repo_url
+
+
+def test_restore_src_path(tmp_path):
+    """The snapshot location recorded by copier is replaced by the real source."""
+    answers_file = tmp_path / ".copier-answers.yml"
+    answers_file.write_text(
+        "# Changes here will be overwritten by Copier; NEVER EDIT MANUALLY\n"
+        "_commit: abc123\n"
+        "_src_path: /tmp/platform-service-framework-xyz\n"
+        "project_name: foo\n"
+    )
+
+    restore_src_path(answers_file, "https://github.com/ansible/platform-service-framework.git")
+
+    content = answers_file.read_text()
+    assert content.startswith("# Changes here will be overwritten by Copier")
+    answers = yaml.safe_load(content)
+    assert answers == {
+        "_commit": "abc123",
+        "_src_path": "https://github.com/ansible/platform-service-framework.git",
+        "project_name": "foo",
+    }
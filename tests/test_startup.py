@@ -0,0 +1,55 @@
+"""Startup budget for the CLI entry point.
+
+Shell completions and `--help` run on every keystroke/terminal, so the entry point must
+not import copier and friends until a command needs them.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["copier", "git", "yaml", "jinja2", "pydantic", "plumbum", "importlib.metadata"]
+# Cumulative import time of the package as reported by `python -X importtime`
+IMPORT_BUDGET_MS = int(os.getenv("FRAMEWORK_IMPORT_BUDGET_MS", "500"))
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("args", [["--help"], ["init", "--help"], ["completions"]])
+def test_cli_does_not_import_heavy_dependencies(args, tmp_path, monkeypatch):
+    """Test help and completions don't load the template machinery."""
+    monkeypatch.setenv("FRAMEWORK_CACHE_DIR", str(tmp_path))
+    result = _run(
+        "import sys\n"
+        "from platform_service_framework.cli import app\n"
+        "try:\n"
+        f"    app({args!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('modules:', *sorted(sys.modules))\n"
+    )
+    modules = set(result.stdout.splitlines()[-1].split()[1:])
+
+    assert [module for module in HEAVY_MODULES if module in modules] == []
+
+
+def test_import_time_budget():
+    """Test importing the CLI stays within the startup budget."""
+    result = _run("import platform_service_framework.cli")
+    match = re.search(r"\|\s*(\d+) \| platform_service_framework.cli$", result.stderr, re.MULTILINE)
+    assert match, result.stderr
+
+    import_ms = int(match.group(1)) / 1000
+    assert import_ms < IMPORT_BUDGET_MS, (
+        f"Importing the CLI took {import_ms:.0f}ms, over the {IMPORT_BUDGET_MS}ms budget"
+    )
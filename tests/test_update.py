@@ -1,11 +1,16 @@
 """Tests for the update command."""
 
+import json
+import os
+from pathlib import Path
 from unittest.mock import ANY, patch
 
 import pytest
 from git import Repo
 
+from platform_service_framework import cli
 from platform_service_framework.cli import app
+from platform_service_framework.preview import diff_file
 
 
 def test_update_default_destination(isolated_env, capsys, local_repo_url):
@@ -17,8 +22,11 @@ def test_update_default_destination(isolated_env, capsys, local_repo_url):
         app(["init"])
     assert exc_info.value.code == 0
 
-    # Mock run_update to avoid actual copier execution
-    with patch("platform_service_framework.cli.run_update") as mock_update:
+    # Mock run_update to avoid actual copier execution, nothing is rendered for the manifest
+    with (
+        patch("platform_service_framework.cli.run_update") as mock_update,
+        patch("platform_service_framework.validation.write_manifest"),
+    ):
         # Run update command - expect SystemExit(0)
         with pytest.raises(SystemExit) as exc_info:
             app(["update"])
@@ -48,8 +56,11 @@ def test_update_with_specific_destination(isolated_dir, local_repo_url, capsys):
         app(["init", str(destination)])
     assert exc_info.value.code == 0
 
-    # Mock run_update
-    with patch("platform_service_framework.cli.run_update") as mock_update:
+    # Mock run_update, nothing is rendered for the manifest
+    with (
+        patch("platform_service_framework.cli.run_update") as mock_update,
+        patch("platform_service_framework.validation.write_manifest"),
+    ):
         # Run update with destination - expect SystemExit(0)
         with pytest.raises(SystemExit) as exc_info:
             app(["update", str(destination)])
@@ -114,4 +125,184 @@ def test_update_dirty_git_repository(isolated_env, capsys):
     captured = capsys.readouterr()
     assert "Updating your app" in captured.out
     assert "Working tree has uncommitted changes" in captured.out
-    assert "Please commit or stash your changes before running update" in captured.out
\ No newline at end of file
+    assert "Please commit or stash your changes before running update" in captured.out
+
+
+def _set_src_branch(answers_file, branch):
+    answers_file.write_text(
+        "\n".join(
+            f"src_branch: {branch}" if line.startswith("src_branch:") else line
+            for line in answers_file.read_text().splitlines()
+        )
+        + "\n"
+    )
+
+
+@pytest.fixture
+def outdated_apps(isolated_env):
+    """Initialized project whose core and api apps point to an old template branch."""
+    tmp_path, _ = isolated_env
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init", "--apps", "api", "web"])
+    assert exc_info.value.code == 0
+
+    repo = Repo(tmp_path)
+    for name in ("core", "api"):
+        _set_src_branch(tmp_path / "apps" / name / ".copier-answers.yml", "old")
+    repo.git.add(A=True)
+    repo.index.commit("Point apps to an old branch")
+    return repo
+
+
+def test_update_all_apps_single_commit(outdated_apps, capsys):
+    """Test update --apps all updates every app and commits once."""
+    repo = outdated_apps
+    head = repo.head.commit
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["update", "--apps", "all"])
+
+    assert exc_info.value.code == 0
+    out = capsys.readouterr().out
+    assert "Updating 4 components" in out
+    assert "No changes from app web update" in out
+    assert repo.head.commit.parents == (head,)
+    assert "Components: core app, app api" in repo.head.commit.message
+    assert set(repo.head.commit.stats.files) == {
+        "apps/core/.copier-answers.yml",
+        "apps/api/.copier-answers.yml",
+    }
+    assert not repo.is_dirty(untracked_files=True)
+    assert len(repo.git.worktree("list").splitlines()) == 1
+
+
+def test_update_apps_per_component(outdated_apps, capsys):
+    """Test update --per-component commits each updated app separately."""
+    repo = outdated_apps
+    head = repo.head.commit
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["update", "--apps", "api", "--per-component"])
+
+    assert exc_info.value.code == 0
+    assert repo.head.commit.parents == (head,)
+    assert repo.head.commit.message.startswith(
+        "[platform-service-framework] Update app api from template"
+    )
+    assert set(repo.head.commit.stats.files) == {"apps/api/.copier-answers.yml"}
+
+
+def test_update_apps_conflict_restores_head(outdated_apps, capsys):
+    """Test a component update that doesn't apply is aborted and reported."""
+    repo = outdated_apps
+    answers_file = Path(repo.working_tree_dir) / "apps" / "api" / ".copier-answers.yml"
+    component_label = cli._component_label
+    pid = os.getpid()
+    local = []
+
+    def label_after_local_change(component):
+        # Conflicting change made once the worktrees are updated, before they are applied
+        if os.getpid() == pid and not local:
+            _set_src_branch(answers_file, "local")
+            repo.git.add(A=True)
+            local.append(repo.index.commit("Point api to a local branch"))
+        return component_label(component)
+
+    with patch("platform_service_framework.cli._component_label", label_after_local_change):
+        with pytest.raises(SystemExit) as exc_info:
+            app(["update", "--apps", "core", "api", "--per-component"])
+
+    assert exc_info.value.code == 1
+    out = capsys.readouterr().out
+    assert "Error: The app api update conflicts" in out
+    assert f"The repository was restored to {local[0].hexsha[:12]}" in out
+    assert repo.head.commit == local[0]
+    assert not repo.is_dirty(untracked_files=True)
+    assert not (Path(repo.git_dir) / "CHERRY_PICK_HEAD").exists()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--apps", "api", "--core"],
+        ["--apps", "api", "--no-intermediate-commits"],
+        ["--apps", "api", "--dry-run"],
+        ["--per-component"],
+    ],
+)
+def test_update_rejects_ignored_options(outdated_apps, capsys, options):
+    """Test options the --apps update would ignore are refused before any change."""
+    repo = outdated_apps
+    head = repo.head.commit
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["update", *options])
+
+    assert exc_info.value.code == 1
+    assert "Error: --" in capsys.readouterr().out
+    assert repo.head.commit == head
+    assert not repo.is_dirty(untracked_files=True)
+
+
+def test_update_without_intermediate_commits(outdated_apps, capsys):
+    """Test --no-intermediate-commits squashes the answers and core app updates."""
+    repo = outdated_apps
+    head = repo.head.commit
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["update", "--core", "--no-intermediate-commits"])
+
+    assert exc_info.value.code == 0
+    assert "Squashed the update into a single commit" in capsys.readouterr().out
+    assert repo.head.commit.parents == (head,)
+    assert "- [platform-service-framework] Update core app template source" in (
+        repo.head.commit.message
+    )
+    assert "apps/core/.copier-answers.yml" in repo.head.commit.stats.files
+    assert not repo.is_dirty(untracked_files=True)
+
+
+def test_update_dry_run(isolated_env, capsys):
+    """Test --dry-run prints the diff of the files changed by the template without updating."""
+    tmp_path, _ = isolated_env
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init"])
+    assert exc_info.value.code == 0
+
+    repo = Repo(tmp_path)
+    with open(tmp_path / "manage.py", "a") as f:
+        f.write("# local change\n")
+    # Pretend the template changed manage.py since the project was rendered
+    manifest = json.loads((tmp_path / ".copier-manifest.json").read_text())
+    manifest["files"]["manage.py"]["sha256"] = "0" * 64
+    (tmp_path / ".copier-manifest.json").write_text(json.dumps(manifest))
+    repo.git.add(A=True)
+    head = repo.index.commit("Local changes")
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["update", "--dry-run"])
+
+    assert exc_info.value.code == 0
+    captured = capsys.readouterr()
+    assert captured.out.startswith("--- a/manage.py\n+++ b/manage.py\n")
+    assert "-# local change\n" in captured.out
+    assert "1 files would change" in captured.err
+    for phase in ("git status", "template fetch", "render", "diff"):
+        assert phase in captured.err
+    assert repo.head.commit == head
+    assert not repo.is_dirty(untracked_files=True)
+
+
+def test_diff_file_new_and_removed(tmp_path):
+    """Test files missing on one side are diffed against /dev/null."""
+    (tmp_path / "new.txt").write_text("new\n")
+
+    added = list(diff_file("new.txt", tmp_path / "missing.txt", tmp_path / "new.txt"))
+    removed = list(diff_file("new.txt", tmp_path / "new.txt", tmp_path / "missing.txt"))
+
+    assert added[:2] == ["--- /dev/null\n", "+++ b/new.txt\n"]
+    assert added[-1] == "+new\n"
+    assert removed[:2] == ["--- a/new.txt\n", "+++ /dev/null\n"]
+    assert removed[-1] == "-new\n"
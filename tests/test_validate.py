@@ -1,10 +1,13 @@
 """Tests for the validate command."""
 
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from platform_service_framework.cli import app
+from platform_service_framework.validation import MANIFEST_FILE, compile_patterns, write_manifest
 
 
 def test_validate_empty_project(isolated_env, capsys):
@@ -136,3 +139,109 @@ def test_validate_protected_file_deletion(isolated_env, capsys):
     assert f"{tmp_path.name}/settings.py" in captured.out
     assert "Please undo these changes and run the command again" in captured.out
 
+
+def test_validate_json_format(isolated_env, capsys):
+    """Test validate reports infractions as JSON."""
+    tmp_path, _ = isolated_env
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init"])
+    assert exc_info.value.code == 0
+    capsys.readouterr()
+
+    (tmp_path / "manage.py").write_text("test")
+    with pytest.raises(SystemExit) as exc_info:
+        app(["validate", "--format", "json"])
+    assert exc_info.value.code == 1
+
+    result = json.loads(capsys.readouterr().out)
+    assert result["valid"] is False
+    assert result["errors"] == []
+    assert {"path": "manage.py", "change": "modified", "protected": True} in result["infractions"]
+
+
+def test_compile_patterns():
+    """Test protected file entries match files and everything below directories."""
+    pattern = compile_patterns(["manage.py", "my_project/", "docs/*.md"])
+
+    assert pattern.match("manage.py")
+    assert pattern.match("my_project/settings.py")
+    assert pattern.match("docs/index.md")
+    assert not pattern.match("apps/api/views.py")
+    assert not compile_patterns([]).match("manage.py")
+
+
+def test_compile_patterns_nested_paths():
+    """Test `*` stays within a directory and `**` matches across directories."""
+    pattern = compile_patterns(["docs/*.md", "config/**/*.yml"])
+
+    assert not pattern.match("docs/guides/index.md")
+    assert not pattern.match("manage.py.md")
+    assert pattern.match("config/base.yml")
+    assert pattern.match("config/env/prod/base.yml")
+    assert not pattern.match("apps/config/base.yml")
+
+
+def test_validate_uses_manifest(isolated_env, capsys):
+    """Test validate checks the working tree against the manifest written by init."""
+    tmp_path, _ = isolated_env
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init"])
+    assert exc_info.value.code == 0
+    assert (tmp_path / MANIFEST_FILE).exists()
+    capsys.readouterr()
+
+    (tmp_path / "manage.py").write_text("test")
+    with pytest.raises(SystemExit) as exc_info:
+        app(["validate", "--format", "json"])
+    assert exc_info.value.code == 1
+
+    result = json.loads(capsys.readouterr().out)
+    assert result["from_manifest"] is True
+    assert [change["path"] for change in result["infractions"]] == ["manage.py"]
+
+
+def test_validate_renders_without_manifest(isolated_env, capsys):
+    """Test validate renders the template when the manifest is missing or stale."""
+    tmp_path, _ = isolated_env
+
+    with pytest.raises(SystemExit) as exc_info:
+        app(["init"])
+    assert exc_info.value.code == 0
+    capsys.readouterr()
+
+    manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+    manifest["answers"] = "stale"
+    (tmp_path / MANIFEST_FILE).write_text(json.dumps(manifest))
+    (tmp_path / "manage.py").unlink()
+    with pytest.raises(SystemExit) as exc_info:
+        app(["validate", "--format", "json"])
+    assert exc_info.value.code == 1
+
+    result = json.loads(capsys.readouterr().out)
+    assert result["from_manifest"] is False
+    assert {"path": "manage.py", "change": "deleted", "protected": True} in result["infractions"]
+
+
+def test_manifest_rendered_again_without_copier_hook(isolated_env):
+    """Test init renders the template for the manifest when copier can't be wrapped."""
+    tmp_path, _ = isolated_env
+
+    with patch("platform_service_framework.validation._render_allowed_hook", return_value=None):
+        with pytest.raises(SystemExit) as exc_info:
+            app(["init"])
+    assert exc_info.value.code == 0
+
+    files = json.loads((tmp_path / MANIFEST_FILE).read_text())["files"]
+    assert "manage.py" in files
+    assert ".copier-answers.yml" not in files
+
+
+def test_empty_manifest_is_refused(tmp_path):
+    """Test a render that recorded no file fails instead of writing an empty manifest."""
+    (tmp_path / ".copier-answers.yml").write_text("_commit: abc\n")
+
+    with pytest.raises(RuntimeError, match="No rendered template file"):
+        write_manifest(tmp_path, str(tmp_path), {})
+    assert not (tmp_path / MANIFEST_FILE).exists()